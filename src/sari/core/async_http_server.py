@@ -21,6 +21,11 @@ from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 from sari.version import __version__
 
+_SEARCH_MAX_LIMIT = 50
+_REPO_CANDIDATES_MAX_LIMIT = 5
+_SNIPPET_MAX_LINES = 20
+_SNIPPET_DEFAULT_LINES = 3
+
 
 class AsyncHttpServer:
     """
@@ -49,6 +54,20 @@ class AsyncHttpServer:
         self.root_ids = root_ids or []
         self.mcp_server = mcp_server
         self._app: Optional[Starlette] = None
+        self._snippet_cfg: Any = None
+        self._snippet_lines = _SNIPPET_DEFAULT_LINES
+    
+    @property
+    def snippet_lines(self) -> int:
+        """Clamped snippet_max_lines, recomputed only when indexer.cfg is replaced."""
+        cfg = getattr(self.indexer, "cfg", None)
+        if cfg is not self._snippet_cfg:
+            try:
+                self._snippet_lines = max(1, min(int(cfg.snippet_max_lines), _SNIPPET_MAX_LINES))
+            except (ValueError, TypeError, AttributeError):
+                self._snippet_lines = _SNIPPET_DEFAULT_LINES
+            self._snippet_cfg = cfg
+        return self._snippet_lines
     
     def _get_system_metrics(self) -> Dict[str, Any]:
         try:
@@ -129,16 +148,11 @@ class AsyncHttpServer:
             engine_mode = st.engine_mode
             index_version = st.index_version
         
-        try:
-            snippet_lines = max(1, min(int(self.indexer.cfg.snippet_max_lines), 20))
-        except (ValueError, TypeError, AttributeError):
-            snippet_lines = 3
-        
         opts = SearchOptions(
             query=q,
             repo=repo,
-            limit=max(1, min(limit, 50)),
-            snippet_lines=snippet_lines,
+            limit=max(1, min(limit, _SEARCH_MAX_LIMIT)),
+            snippet_lines=self.snippet_lines,
             root_ids=self.root_ids,
             total_mode="exact",
         )
@@ -176,7 +190,7 @@ class AsyncHttpServer:
         if not q:
             return JSONResponse({"ok": False, "error": "missing q"}, status_code=400)
         
-        cands = self.db.repo_candidates(q=q, limit=max(1, min(limit, 5)), root_ids=self.root_ids)
+        cands = self.db.repo_candidates(q=q, limit=max(1, min(limit, _REPO_CANDIDATES_MAX_LIMIT)), root_ids=self.root_ids)
         return JSONResponse({"ok": True, "q": q, "candidates": cands})
     
     async def mcp_post(self, request: Request) -> Response:
@@ -1,4 +1,5 @@
 import os
+import re
 import sys
 import threading
 from pathlib import Path
@@ -11,6 +12,9 @@ _LINDERA_DICT_PATH = ""
 _LINDERA_DICT_URI = ""
 _LINDERA_READY = False
 
+# Han, Kana and Hangul ranges; scanned in C instead of an ord() loop per character.
+_CJK_RE = re.compile(r"[\u1100-\u11ff\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7a3]")
+
 
 def _resolve_dict_path() -> str:
     env = (os.environ.get("SARI_LINDERA_DICT_PATH") or "").strip()
@@ -91,43 +95,17 @@ def lindera_dict_uri() -> str:
 
 
 def has_cjk(text: str) -> bool:
-    for ch in text:
-        code = ord(ch)
-        if (
-            0x4E00 <= code <= 0x9FFF
-            or 0x3400 <= code <= 0x4DBF
-            or 0x3040 <= code <= 0x30FF
-            or 0xAC00 <= code <= 0xD7A3
-            or 0x1100 <= code <= 0x11FF
-        ):
-            return True
-    return False
+    return _CJK_RE.search(text) is not None
 
 
 def _is_cjk_char(ch: str) -> bool:
-    code = ord(ch)
-    return (
-        (0x4E00 <= code <= 0x9FFF)
-        or (0x3400 <= code <= 0x4DBF)
-        or (0x3040 <= code <= 0x30FF)
-        or (0xAC00 <= code <= 0xD7A3)
-        or (0x1100 <= code <= 0x11FF)
-    )
+    return _CJK_RE.match(ch) is not None
 
 
 def _fallback_cjk_space(text: str) -> str:
     if not text:
         return text
-    out = []
-    for ch in text:
-        if _is_cjk_char(ch):
-            if out and out[-1] != " ":
-                out.append(" ")
-            out.append(ch)
-            out.append(" ")
-        else:
-            out.append(ch)
-    return " ".join("".join(out).split())
+    return " ".join(_CJK_RE.sub(r" \g<0> ", text).split())
 
 
 def cjk_space(text: str) -> str:
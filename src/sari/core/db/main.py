@@ -1,12 +1,15 @@
 import os
 import logging
 from typing import List, Dict, Any, Optional
-from peewee import SqliteDatabase
+from peewee import SqliteDatabase, chunked
 from .models import db_proxy, File, Symbol, Relation, Root
 from sari.core.settings import settings
 
 logger = logging.getLogger("sari.db")
 
+# 12 bound columns per file row; stays under SQLite's 999-variable default.
+_UPSERT_CHUNK_ROWS = 80
+
 try:
     import tantivy
     HAS_TANTIVY = True
@@ -21,9 +24,12 @@ class LocalSearchDB:
             'cache_size': -1 * 64000,
             'foreign_keys': 1,
             'busy_timeout': 10000,
-            'synchronous': 'normal'
+            'synchronous': 'normal',
+            'temp_store': 'memory',
+            'mmap_size': settings.MMAP_SIZE,
         })
         db_proxy.initialize(self.db)
+        self._file_meta: Optional[Dict[str, tuple]] = None
         self.db.create_tables([File, Symbol, Relation, Root])
         
         self.engine = None
@@ -33,22 +39,26 @@ class LocalSearchDB:
             self.engine = TantivyEngine(idx_path)
 
     def upsert_files_turbo(self, batch: List[Dict[str, Any]]):
+        if not batch:
+            return
+        rows = ({
+            "path": task["rel"],
+            "repo": task.get("repo", ""),
+            "content": task.get("content", ""),
+            "content_hash": task.get("content_hash", ""),
+            "size": task.get("size", 0),
+            "mtime": task.get("mtime", 0),
+            "scan_ts": task.get("scan_ts", 0),
+            "parse_status": task.get("parse_status", "ok"),
+            "ast_status": task.get("ast_status", "ok"),
+            "is_binary": task.get("is_binary", 0),
+            "is_minified": task.get("is_minified", 0),
+            "metadata_json": task.get("metadata_json", "{}"),
+        } for task in batch)
+        # One multi-row INSERT per chunk instead of one statement per file.
         with self.db.atomic():
-            for task in batch:
-                File.insert(
-                    path=task["rel"],
-                    repo=task.get("repo", ""),
-                    content=task.get("content", ""),
-                    content_hash=task.get("content_hash", ""),
-                    size=task.get("size", 0),
-                    mtime=task.get("mtime", 0),
-                    scan_ts=task.get("scan_ts", 0),
-                    parse_status=task.get("parse_status", "ok"),
-                    ast_status=task.get("ast_status", "ok"),
-                    is_binary=task.get("is_binary", 0),
-                    is_minified=task.get("is_minified", 0),
-                    metadata_json=task.get("metadata_json", "{}")
-                ).on_conflict_replace().execute()
+            for chunk in chunked(rows, _UPSERT_CHUNK_ROWS):
+                File.insert_many(chunk).on_conflict_replace().execute()
 
     def finalize_turbo_batch(self):
         """Force commit and checkpoint for SQLite."""
@@ -75,5 +85,37 @@ class LocalSearchDB:
         files = File.select().limit(limit)
         return [{"path": f.path, "size": f.size, "repo": f.repo} for f in files]
 
-    def preload_metadata(self): pass
+    def preload_metadata(self):
+        """Load (mtime, size, content_hash) for every file in one query so the
+        scan's per-file change checks don't each hit SQLite."""
+        query = File.select(File.path, File.mtime, File.size, File.content_hash).tuples()
+        self._file_meta = {path: (mtime, size, content_hash) for path, mtime, size, content_hash in query}
+
+    def clear_metadata(self):
+        """Drop the scan's preloaded snapshot so later lookups read the current rows."""
+        self._file_meta = None
+
+    def get_file_meta(self, path: str) -> Optional[tuple]:
+        if self._file_meta is not None:
+            return self._file_meta.get(path)
+        row = (File.select(File.mtime, File.size, File.content_hash)
+               .where(File.path == path).tuples().first())
+        return tuple(row) if row else None
+
+    def update_last_seen(self, paths: List[str], ts: int):
+        if not paths:
+            return
+        with self.db.atomic():
+            for chunk in chunked(paths, _UPSERT_CHUNK_ROWS):
+                File.update(last_seen_ts=ts).where(File.path.in_(chunk)).execute()
+
+    def update_file_stats(self, stats: List[tuple], ts: int):
+        """Record new (path, mtime, size) for files whose content hash did not change,
+        so the next scan's stat check settles them without re-reading."""
+        if not stats:
+            return
+        with self.db.atomic():
+            for path, mtime, size in stats:
+                File.update(mtime=mtime, size=size, last_seen_ts=ts).where(File.path == path).execute()
+
     def prune_stale_files(self, ts): pass
@@ -132,7 +132,7 @@ class GlobalStorageManager:
         results = []
         q = (query or "").lower()
         with self._overlay_lock:
-            for path, row in reversed(list(self._overlay_files.items())):
+            for path, row in reversed(self._overlay_files.items()):
                 if len(results) >= limit:
                     break
                 if root_id and row[2] != root_id:
@@ -1,10 +1,12 @@
 import os
+import queue
 import shutil
+import sys
 import threading
 import time
 import re
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 
 from sari.core.settings import settings
 
@@ -13,11 +15,46 @@ try:
 except ImportError:
     tantivy = None
 
+# Documents are built ahead of time and handed to the writer in chunks of this size.
+_ADD_BATCH = 4096
+# Tantivy needs ~15MB per indexing thread before it starts flushing a segment per document.
+_MIN_WRITER_MB_PER_THREAD = 20
+_MIN_WRITER_MB = 128
+# Writes share one long-lived writer and are committed on this throttle.
+_COMMIT_EVERY_DOCS = 512
+_COMMIT_INTERVAL_SEC = 1.0
+# status() is polled; the on-disk index size is recomputed at most this often.
+_INDEX_SIZE_TTL_SEC = 2.0
+# rebuild() keeps at most this many _ADD_BATCH chunks fetched ahead of the writer.
+_REBUILD_QUEUE_CHUNKS = 8
+
+
+def _dir_size(root: str) -> int:
+    """Sum file sizes under ``root`` using scandir's cached entry types (one stat per file)."""
+    size = 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return size
+
+
 class TantivyEngine:
     """
     Tantivy-based search engine for Sari.
     Unified global index with root_id filtering.
     """
+
     def __init__(self, index_path: str, logger=None, settings_obj=None):
         self.index_path = Path(index_path)
         self.logger = logger
@@ -25,9 +62,15 @@ class TantivyEngine:
         self._index = None
         self._schema = None
         self._writer = None
+        self._uncommitted = 0
+        self._last_commit_ts = 0.0
+        self._index_size_cache: Tuple[int, float] = (0, 0.0)
         self._last_reload_ts = 0.0
         self._writer_lock = threading.Lock()
         self._reload_lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+        # Writes made while rebuild() builds its replacement index, replayed before the swap.
+        self._journal: Optional[List[Tuple[str, str, Any]]] = None
         self._disabled_reason = ""
         self._tantivy = tantivy
 
@@ -83,46 +126,228 @@ class TantivyEngine:
     def upsert_documents(self, docs: List[Dict[str, Any]]):
         if not tantivy or not self._index: return
         
+        # Last write wins when the same doc_id shows up twice in one batch.
+        pending: Dict[str, Dict[str, Any]] = {}
+        for d in docs:
+            doc_id = d.get("doc_id") or d.get("id")
+            if doc_id:
+                pending[doc_id] = d
+        if not pending:
+            return
+
         with self._writer_lock:
-            # Ticket 5.4: Enforce memory budget for indexing
-            memory_budget = self.settings.ENGINE_INDEX_MEM_MB * 1024 * 1024
-            if self._writer is None:
-                self._writer = self._index.writer(memory_budget)
-            writer = self._writer
-            
-            for d in docs:
-                doc_id = d.get("doc_id") or d.get("id")
-                if not doc_id:
-                    continue
-                body_text = d.get("body_text", "")
-                if hasattr(writer, "delete_documents"):
-                    writer.delete_documents("path", doc_id)
-                else:
-                    writer.delete_term("path", doc_id)
-                writer.add_document(tantivy.Document(
-                    root_id=d.get("root_id", ""),
-                    path=doc_id,
-                    repo=d.get("repo", ""),
-                    body=body_text,
-                    body_raw=body_text, # Priority 7: Feed raw content for CJK matching
-                    mtime=d.get("mtime", 0),
-                    size=d.get("size", 0)
-                ))
+            writer = self._get_writer()
+
+            # Deletes only affect documents added before them, so issue them all first.
+            for doc_id in pending:
+                self._delete_term(writer, doc_id)
+
+            batch = []
+            for doc_id, d in pending.items():
+                batch.append(self._make_document(doc_id, d))
+                if len(batch) >= _ADD_BATCH:
+                    self._flush_batch(writer, batch)
+            self._flush_batch(writer, batch)
+            self._uncommitted += len(pending)
+            if self._journal is not None:
+                self._journal.extend(("add", doc_id, d) for doc_id, d in pending.items())
+            self._commit_pending()
+
+    def rebuild(self, docs: Iterable[Dict[str, Any]]) -> int:
+        """
+        Replace the whole index with ``docs``.
+        The new index is built in a sibling directory without holding the writer lock; a
+        background thread pulls chunks from ``docs`` into a bounded queue so slow fetches
+        (SQLite) overlap with tantivy's indexing threads. Writes that arrive meanwhile go to
+        the live index and are also journaled, then replayed into the new index before the
+        swap.
+        """
+        if not tantivy or not self._index: return 0
+        with self._rebuild_lock:
+            tmp_dir = self.index_path.with_name(self.index_path.name + ".rebuild")
+            with self._writer_lock:
+                self._journal = []
+            try:
+                total = self._build_index(tmp_dir, docs)
+                with self._writer_lock:
+                    journal, self._journal = self._journal, None
+                    if journal:
+                        writer = self._index_writer(tantivy.Index(self._schema, path=str(tmp_dir)))
+                        self._replay(writer, journal)
+                        writer.commit()
+                        writer = None
+                    self._swap_in(tmp_dir)
+            except BaseException:
+                with self._writer_lock:
+                    self._journal = None
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+        return total
+
+    def _build_index(self, tmp_dir: Path, docs: Iterable[Dict[str, Any]]) -> int:
+        chunks: "queue.Queue[Any]" = queue.Queue(maxsize=_REBUILD_QUEUE_CHUNKS)
+        done = object()
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        def _produce():
+            try:
+                chunk = []
+                for d in docs:
+                    if stop.is_set():
+                        return
+                    chunk.append(d)
+                    if len(chunk) >= _ADD_BATCH:
+                        chunks.put(chunk)
+                        chunk = []
+                if chunk:
+                    chunks.put(chunk)
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                chunks.put(done)
+
+        total = 0
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        writer = self._index_writer(tantivy.Index(self._schema, path=str(tmp_dir)))
+        producer = threading.Thread(target=_produce, name="sari-engine-rebuild", daemon=True)
+        producer.start()
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is done:
+                    break
+                batch = []
+                for d in chunk:
+                    doc_id = d.get("doc_id") or d.get("id")
+                    if doc_id:
+                        batch.append(self._make_document(doc_id, d))
+                total += len(batch)
+                self._flush_batch(writer, batch)
+            producer.join()
+            if errors:
+                raise errors[0]
             writer.commit()
-            # Wait for merge to complete in a real env, but for local tool commit is enough
+            writer.wait_merging_threads()
+        except BaseException:
+            stop.set()
+            while producer.is_alive() and chunks.get() is not done:
+                pass
+            raise
+        return total
+
+    def _replay(self, writer, journal: List[Tuple[str, Any]]) -> None:
+        """Apply writes journaled during a rebuild, in order, to the rebuilt index."""
+        for op, doc_id, d in journal:
+            self._delete_term(writer, doc_id)
+            if op == "add":
+                writer.add_document(self._make_document(doc_id, d))
+
+    def _swap_in(self, tmp_dir: Path) -> None:
+        # Caller holds _writer_lock. The live index is moved aside rather than deleted
+        # first, so a failed move leaves it intact and still in place.
+        self._commit_pending(force=True)
+        self._writer = None
+        old_dir = self.index_path.with_name(self.index_path.name + ".old")
+        shutil.rmtree(old_dir, ignore_errors=True)
+        os.replace(self.index_path, old_dir)
+        try:
+            os.replace(tmp_dir, self.index_path)
+        except OSError:
+            os.replace(old_dir, self.index_path)
+            raise
+        self._index = tantivy.Index(self._schema, path=str(self.index_path))
+        self._uncommitted = 0
+        self._last_commit_ts = time.monotonic()
+        self._last_reload_ts = 0.0
+        self._index_size_cache = (0, 0.0)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+    @staticmethod
+    def _make_document(doc_id: str, d: Dict[str, Any]):
+        body_text = d.get("body_text", "")
+        return tantivy.Document(
+            root_id=d.get("root_id", ""),
+            path=doc_id,
+            repo=d.get("repo", ""),
+            body=body_text,
+            body_raw=body_text, # Priority 7: Feed raw content for CJK matching
+            mtime=d.get("mtime", 0),
+            size=d.get("size", 0)
+        )
+
+    def _writer_limits(self) -> Tuple[int, int]:
+        """Return (heap_bytes, threads) with the heap floored so segments are not flushed per document."""
+        try:
+            threads = max(1, int(getattr(self.settings, "ENGINE_THREADS", 2) or 2))
+        except (TypeError, ValueError):
+            threads = 2
+        requested_mb = int(self.settings.ENGINE_INDEX_MEM_MB)
+        mem_mb = max(requested_mb, threads * _MIN_WRITER_MB_PER_THREAD, _MIN_WRITER_MB)
+        if mem_mb != requested_mb:
+            sys.stderr.write(f"[sari] engine index memory raised from {requested_mb}MB to {mem_mb}MB ({threads} threads)\n")
+        return mem_mb * 1024 * 1024, threads
+
+    def _get_writer(self):
+        # Caller holds _writer_lock.
+        if self._writer is None:
+            self._writer = self._index_writer()
+        return self._writer
+
+    def _commit_pending(self, force: bool = False) -> None:
+        # Caller holds _writer_lock.
+        if self._writer is None or not self._uncommitted:
+            return
+        now = time.monotonic()
+        if force or self._uncommitted >= _COMMIT_EVERY_DOCS or (now - self._last_commit_ts) >= _COMMIT_INTERVAL_SEC:
+            self._writer.commit()
+            self._uncommitted = 0
+            self._last_commit_ts = now
+            self._index_size_cache = (0, 0.0)
+
+    def commit(self) -> None:
+        """Commit any writes still held back by the commit throttle."""
+        if not tantivy or not self._index:
+            return
+        with self._writer_lock:
+            self._commit_pending(force=True)
+
+    def _index_writer(self, index=None):
+        # Ticket 5.4: Enforce memory budget for indexing
+        memory_budget, threads = self._writer_limits()
+        return (index or self._index).writer(memory_budget, threads)
+
+    @staticmethod
+    def _delete_term(writer, doc_id: str) -> None:
+        if hasattr(writer, "delete_documents"):
+            writer.delete_documents("path", doc_id)
+        else:
+            writer.delete_term("path", doc_id)
+
+    @staticmethod
+    def _flush_batch(writer, batch: List[Any]) -> None:
+        """Hand a chunk of prebuilt documents to the writer in as few calls as the binding allows."""
+        if not batch:
+            return
+        add_many = getattr(writer, "add_documents", None)
+        if add_many is not None:
+            add_many(batch)
+        else:
+            for doc in batch:
+                writer.add_document(doc)
+        batch.clear()
 
     def delete_documents(self, doc_ids: List[str]):
         if not tantivy or not self._index: return
         with self._writer_lock:
-            if self._writer is None:
-                self._writer = self._index.writer()
-            writer = self._writer
+            writer = self._get_writer()
             for doc_id in doc_ids:
-                if hasattr(writer, "delete_documents"):
-                    writer.delete_documents("path", doc_id)
-                else:
-                    writer.delete_term("path", doc_id)
-            writer.commit()
+                self._delete_term(writer, doc_id)
+            self._uncommitted += len(doc_ids)
+            if self._journal is not None:
+                self._journal.extend(("delete", doc_id, None) for doc_id in doc_ids)
+            self._commit_pending()
 
     def close(self) -> None:
         if not tantivy:
@@ -136,6 +361,18 @@ class TantivyEngine:
                 # Tantivy writer doesn't always have a close() method in all versions,
                 # but setting it to None triggers cleanup in the binding.
                 self._writer = None
+                self._uncommitted = 0
+                self._index_size_cache = (0, 0.0)
+
+    def index_size_bytes(self) -> int:
+        """On-disk size of the index, cached for a couple of seconds and dropped on commit."""
+        size, ts = self._index_size_cache
+        now = time.monotonic()
+        if ts and (now - ts) < _INDEX_SIZE_TTL_SEC:
+            return size
+        size = _dir_size(str(self.index_path))
+        self._index_size_cache = (size, now)
+        return size
 
     def _escape_query(self, text: str) -> str:
         if text is None:
@@ -150,11 +387,29 @@ class TantivyEngine:
                 out.append(ch)
         return "".join(out)
 
-    def search(self, query: str, root_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    def _filter_clauses(self, root_id: Optional[str], repo: Optional[str], file_types: Optional[List[str]]) -> List[Any]:
+        """Term/regex clauses ANDed with the user query so filtering happens inside the top-k collector."""
+        clauses = []
+        if root_id:
+            clauses.append(tantivy.Query.term_query(self._schema, "root_id", root_id))
+        if repo:
+            clauses.append(tantivy.Query.term_query(self._schema, "repo", repo))
+        exts = sorted({str(e).lower().lstrip(".") for e in (file_types or []) if e and str(e).strip(".")})
+        if exts:
+            alternation = "|".join(re.escape(e) for e in exts)
+            clauses.append(tantivy.Query.regex_query(self._schema, "path", f"(?i).*\\.({alternation})"))
+        return clauses
+
+    def search(self, query: str, root_id: Optional[str] = None, limit: int = 50,
+               repo: Optional[str] = None, file_types: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         if not tantivy or not self._index: return []
         
         now = time.time()
         reload_interval = max(0, self.settings.ENGINE_RELOAD_MS) / 1000.0
+
+        # Publish writes held back by the commit throttle once they are due (or always, when reloads are unthrottled).
+        if self._uncommitted and (reload_interval == 0 or (time.monotonic() - self._last_commit_ts) >= _COMMIT_INTERVAL_SEC):
+            self.commit()
         
         # Reader reload uses a separate lock to avoid multiple reloads in parallel
         if reload_interval == 0 or (now - self._last_reload_ts) >= reload_interval:
@@ -166,15 +421,13 @@ class TantivyEngine:
 
         searcher = self._index.searcher()
         
-        # Build query: (body:query) AND (root_id:root_id)
+        # Build query: (body:query) AND root_id/repo/extension filters
         safe_q = self._escape_query(query or "")
-        safe_root = self._escape_query(root_id or "")
-        full_query = f"body:({safe_q})"
-        if root_id:
-            full_query = f"({full_query}) AND root_id:\"{safe_root}\""
-            
         try:
-            q = self._index.parse_query(full_query, ["body"])
+            q = self._index.parse_query(f"body:({safe_q})", ["body"])
+            filters = self._filter_clauses(root_id, repo, file_types)
+            if filters:
+                q = tantivy.Query.boolean_query([(tantivy.Occur.Must, c) for c in [q] + filters])
         except Exception as e:
             if self.logger: self.logger.log_error(f"Tantivy query parse failed: {e}")
             return []
@@ -183,13 +436,14 @@ class TantivyEngine:
             
             results = []
             for score, address in hits:
-                doc = searcher.doc(address)
+                # get_first skips the per-field list doc[...] builds; the stored body is never read.
+                get = searcher.doc(address).get_first
                 results.append({
-                    "path": doc["path"][0],
-                    "root_id": doc["root_id"][0],
-                    "repo": doc["repo"][0],
-                    "mtime": doc["mtime"][0],
-                    "size": doc["size"][0],
+                    "path": get("path"),
+                    "root_id": get("root_id"),
+                    "repo": get("repo"),
+                    "mtime": get("mtime"),
+                    "size": get("size"),
                     "score": score
                 })
             return results
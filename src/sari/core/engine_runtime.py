@@ -1,15 +1,32 @@
 import os
 import logging
+import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from sari.core.workspace import WorkspaceManager
 from sari.core.engine.tantivy_engine import TantivyEngine
 from sari.core.search_engine import SearchEngine
 from sari.core.settings import settings
+from sari.core.utils.text import _normalize_engine_text
 
 logger = logging.getLogger("sari.engine")
 
+
+def _stream_rows(db_path: str, sql: str, params: List[Any]) -> Iterator[Tuple]:
+    """Yield query rows from a private read-only connection owned by the consuming thread."""
+    conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        cur = conn.execute(sql, params)
+        while True:
+            rows = cur.fetchmany(1000)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        conn.close()
+
+
 class EngineError(RuntimeError):
     def __init__(self, code: str, message: str, hint: str = ""):
         super().__init__(message)
@@ -28,6 +45,7 @@ class EngineMeta:
     tokenizer_ready: bool = True
     tokenizer_bundle_tag: str = ""
     tokenizer_bundle_path: str = ""
+    index_size_bytes: int = 0
 
 class EngineRuntime:
     """Manages the Tantivy engine (Phase 5)."""
@@ -62,15 +80,21 @@ class EngineRuntime:
     def delete_documents(self, doc_ids: List[str]):
         if self.engine: self.engine.delete_documents(doc_ids)
 
-    def search(self, query: str, root_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
-        return self.engine.search(query, root_id=root_id, limit=limit) if self.engine else []
+    def search(self, query: str, root_id: Optional[str] = None, limit: int = 50, **filters: Any) -> List[Dict[str, Any]]:
+        return self.engine.search(query, root_id=root_id, limit=limit, **filters) if self.engine else []
 
     def status(self) -> EngineMeta:
         ready = bool(self.engine)
         if not ready:
             return EngineMeta(engine_mode="embedded", engine_ready=False, reason="NOT_INSTALLED", hint="sari --cmd engine install")
         version = getattr(getattr(self.engine, "_tantivy", None), "__version__", "unknown")
-        return EngineMeta(engine_mode="embedded", engine_ready=True, engine_version=version)
+        index_size = 0
+        if hasattr(self.engine, "index_size_bytes"):
+            try:
+                index_size = int(self.engine.index_size_bytes())
+            except Exception:
+                index_size = 0
+        return EngineMeta(engine_mode="embedded", engine_ready=True, engine_version=version, index_size_bytes=index_size)
 
     def close(self) -> None:
         if self.engine and hasattr(self.engine, "close"):
@@ -114,16 +138,19 @@ class EngineRouter:
             if engine:
                 engine.delete_documents(batch)
 
-    def search(self, query: str, root_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    def search(self, query: str, root_id: Optional[str] = None, limit: int = 50, **filters: Any) -> List[Dict[str, Any]]:
         if root_id:
             engine = self.engines.get(root_id)
-            return engine.search(query, root_id=root_id, limit=limit) if engine else []
+            return engine.search(query, root_id=root_id, limit=limit, **filters) if engine else []
         results: List[Dict[str, Any]] = []
         for rid, engine in self.engines.items():
-            results.extend(engine.search(query, root_id=rid, limit=limit))
+            results.extend(engine.search(query, root_id=rid, limit=limit, **filters))
         results.sort(key=lambda r: r.get("score", 0.0), reverse=True)
         return results[:limit]
 
+    def index_size_bytes(self) -> int:
+        return sum(engine.index_size_bytes() for engine in self.engines.values())
+
 
 class EmbeddedEngine:
     """Search + Index wrapper for embedded mode."""
@@ -158,6 +185,43 @@ class EmbeddedEngine:
         if self.runtime.engine:
             self.runtime.engine.delete_documents(doc_ids)
 
+    def rebuild(self) -> None:
+        """Re-index every live file row from the DB into the engine."""
+        engine = self.runtime.engine
+        if engine is None:
+            raise EngineError("ERR_ENGINE_NOT_INSTALLED", "engine not installed", "sari --cmd engine install")
+        if isinstance(engine, EngineRouter):
+            for rid, sub in engine.engines.items():
+                sub.rebuild(self.iter_engine_documents([rid]))
+        else:
+            engine.rebuild(self.iter_engine_documents(self.root_ids))
+
+    def iter_engine_documents(self, root_ids: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Engine docs for the live rows of the files table. rebuild() consumes this on its
+        producer thread, so rows are streamed over a dedicated read-only connection opened
+        there; without an on-disk DB they are fetched up front on the calling thread.
+        """
+        sql = "SELECT path, root_id, repo, mtime, size, fts_content FROM files WHERE deleted_ts = 0"
+        params: List[Any] = []
+        if root_ids:
+            sql += f" AND root_id IN ({','.join('?' * len(root_ids))})"
+            params.extend(root_ids)
+        max_bytes = int(getattr(self.settings, "ENGINE_MAX_DOC_BYTES", 50000))
+        db_path = getattr(self.db, "db_path", None)
+        if db_path and str(db_path) != ":memory:":
+            return self._engine_documents(_stream_rows(str(db_path), sql, params), max_bytes)
+        rows = self.db._get_conn().execute(sql, params).fetchall()
+        return self._engine_documents(rows, max_bytes)
+
+    @staticmethod
+    def _engine_documents(rows: Iterable[Tuple], max_bytes: int) -> Iterator[Dict[str, Any]]:
+        for path, root_id, repo, mtime, size, body in rows:
+            yield {
+                "doc_id": path, "root_id": root_id, "repo": repo, "mtime": mtime, "size": size,
+                "body_text": _normalize_engine_text(body or "")[:max_bytes],
+            }
+
     def close(self) -> None:
         self.runtime.close()
 
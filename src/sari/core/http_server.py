@@ -1,113 +1,421 @@
 import json
 import os
+import queue
+import socket
 import threading
 import mimetypes
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from pathlib import Path
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus
 from sari.version import __version__
+from sari.core.settings import settings
 
-try:
+if TYPE_CHECKING:
+    # Annotation-only: importing the DB/indexer stack here would tax every CLI start.
     from .db import LocalSearchDB
     from .indexer import Indexer
+
+try:
     from .models import SearchOptions
     from .http_middleware import run_http_middlewares, default_http_middlewares
+    from .workspace import WorkspaceManager
     from .utils.system import get_system_metrics
 except ImportError:
-    from db import LocalSearchDB
-    from indexer import Indexer
     from models import SearchOptions
     from http_middleware import run_http_middlewares, default_http_middlewares
+    from workspace import WorkspaceManager
     from utils.system import get_system_metrics
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+_STATUS_TTL_SEC = 0.25
+_SEARCH_MAX_LIMIT = 200
+# Encoded /search responses kept per (q, limit, last commit); large requests bypass the memo.
+_SEARCH_CACHE_MAX = 256
+# Tantivy publishes a DB commit only after its own commit throttle (~1s) plus the reader reload
+# (ENGINE_RELOAD_MS), so a memo entry may predate writes its key claims; it expires after that lag.
+_SEARCH_CACHE_TTL_SEC = 1.0
+_SEARCH_CACHE_MAX_QUERY = 256
+_SEARCH_CACHE_MAX_LIMIT = 20
+# Callers waiting on a coalesced /search give up after this long.
+_SEARCH_TIMEOUT_SEC = 30.0
+# POST /search-batch bounds: queries per request and request body size.
+_BATCH_MAX_QUERIES = 32
+_BATCH_MAX_BODY = 1024 * 1024
+
+
+def _json_default(obj):
+    # orjson encodes dataclasses (SearchHit) itself; other objects fall back to their field dict.
+    fields = getattr(obj, "__dict__", None)
+    if fields is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return fields
+
+
+def _json_bytes(obj) -> bytes:
+    if _orjson:
+        return _orjson.dumps(obj, default=_json_default, option=_orjson.OPT_NON_STR_KEYS | _orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def _json_loads(raw: bytes):
+    if _orjson:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(raw)
+
+
+def _qint(qs: dict, key: str, default: int, lo: int, hi: int) -> int:
+    """Clamped integer query param; missing or malformed values fall back to ``default``."""
+    v = qs.get(key)
+    if not v:
+        return default
+    try:
+        return min(max(int(v), lo), hi)
+    except (TypeError, ValueError):
+        return default
+
+
+_HEALTH_BODY = _json_bytes({"ok": True})
+_MISSING_Q_BODY = _json_bytes({"ok": False, "error": "missing q"})
+_STATUS_TEMPLATE = (
+    b'{"ok":true,"version":%b,"index_ready":%b,"last_scan_ts":%b,"scanned_files":%d,'
+    b'"indexed_files":%d,"repo_stats":%b,"roots":%b,"system_metrics":%b}'
+)
+_JSON_CTYPE = "application/json; charset=utf-8"
+# wfile is unbuffered (one sendall per write); bodies past this size skip the header+body concat.
+_SENDMSG_MIN_BYTES = 64 * 1024
+# Common case (200 JSON on a kept-alive connection) only formats the length into a fixed header block.
+_JSON_200_HEAD = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json; charset=utf-8\r\n"
+    b"Connection: keep-alive\r\nContent-Length: %d\r\n\r\n"
+)
+_HEAD_TEMPLATE = b"HTTP/1.1 %d %b\r\nContent-Type: %b\r\nContent-Length: %d\r\nConnection: %b\r\n\r\n"
+
+
+def _parse_qs_fast(raw_qs: str) -> dict:
+    """Single-value query parsing: first occurrence wins, blank values read as missing (like parse_qs()[0])."""
+    out = {}
+    if not raw_qs:
+        return out
+    for kv in raw_qs.split("&"):
+        k, _, v = kv.partition("=")
+        if not k or not v:
+            continue
+        k = unquote_plus(k)
+        if k not in out:
+            out[k] = unquote_plus(v)
+    return out
+
+
+
 class Handler(BaseHTTPRequestHandler):
-    db: LocalSearchDB
-    indexer: Indexer
+    db: "LocalSearchDB"
+    indexer: "Indexer"
     server_host: str = "127.0.0.1"
     server_port: int = 47777
     server_version: str = __version__
-    root_ids: list[str] = []
+    root_ids: tuple = ()
+    _root_ids_roots: tuple = ()
     mcp_server = None
     middlewares = default_http_middlewares()
     start_time: float = time.time()
+    # Keep-alive lets the dashboard's 2s polling reuse one connection; a client's
+    # "Connection: close" is honoured by parse_request and echoed by _write_response.
+    protocol_version = "HTTP/1.1"
+    # Socket timeout while a request is being read or written.
+    timeout = 30
+    # Small single-write responses should not wait on Nagle's algorithm.
+    disable_nagle_algorithm = True
+    # Encoded /status body shared by pollers for _STATUS_TTL_SEC.
+    _status_cache: tuple[float, bytes] = (0.0, b"")
+    _status_lock = threading.Lock()
+    _search_cache: "OrderedDict[tuple, tuple[float, bytes]]" = OrderedDict()
+    _search_cache_ttl = _SEARCH_CACHE_TTL_SEC
+    _search_lock = threading.Lock()
+    # Requests run on pool threads (PooledHTTPServer), so db/indexer accessors
+    # must be thread-safe; this caps how many handlers touch them at once.
+    _request_slots = threading.BoundedSemaphore(16)
+    # Optional db/indexer capabilities, resolved once in serve_forever rather than probed per request.
+    _db_path = None
+    _version_json = _json_bytes(__version__)
+    _last_commit_ts_fn = None
+    _search_batcher = None
+
+    def setup(self):
+        super().setup()  # applies TCP_NODELAY via disable_nagle_algorithm
+        # Long-idle keep-alive peers that vanish are noticed by the kernel rather than only by timeout.
+        try:
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass
+
+    def handle(self):
+        # A kept-alive connection holds its pool worker while it waits for the next request, so
+        # that wait uses the server's shorter idle timeout; parse_request restores the full one.
+        idle = getattr(self.server, "keepalive_timeout", None)
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            if idle:
+                self.connection.settimeout(idle)
+            self.handle_one_request()
+
+    def parse_request(self):
+        self.connection.settimeout(self.timeout)
+        return super().parse_request()
 
     def _get_db_size(self):
+        if not self._db_path:
+            return 0
         try:
-            return os.path.getsize(self.db.db_path) if hasattr(self.db, "db_path") else 0
-        except: return 0
+            return os.path.getsize(self._db_path)
+        except OSError: return 0
+
+    def _write_response(self, status: int, content_type: str, body: bytes) -> None:
+        """Emit status line, headers and body with a single write."""
+        if status == 200 and content_type == _JSON_CTYPE and not self.close_connection:
+            head = _JSON_200_HEAD % len(body)
+        else:
+            reason = self.responses.get(status, ("",))[0]
+            head = _HEAD_TEMPLATE % (
+                status, reason.encode("latin-1"), content_type.encode("latin-1"), len(body),
+                b"close" if self.close_connection else b"keep-alive",
+            )
+        if len(body) >= _SENDMSG_MIN_BYTES and hasattr(self.connection, "sendmsg"):
+            self._sendmsg_all(head, body)
+        else:
+            self.wfile.write(head + body)
+
+    def _sendmsg_all(self, head: bytes, body: bytes) -> None:
+        # Scatter-gather send: large bodies go out without being copied behind the header.
+        bufs = [memoryview(head), memoryview(body)]
+        while bufs:
+            sent = self.connection.sendmsg(bufs)
+            while bufs and sent >= len(bufs[0]):
+                sent -= len(bufs[0])
+                bufs.pop(0)
+            if bufs and sent:
+                bufs[0] = bufs[0][sent:]
 
     def _json(self, obj, status=200):
-        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+        body = _json_bytes(obj)
+        self._write_response(status, _JSON_CTYPE, body)
 
     def log_message(self, format, *args): return
 
     def do_GET(self):
-        parsed = urlparse(self.path)
-        path, qs = parsed.path, parse_qs(parsed.query)
+        with self._request_slots:
+            self._do_get()
+
+    def _do_get(self):
+        # Local URLs only: split off the query instead of a full urlparse, parse it lazily per route.
+        path, _, raw_qs = self.path.partition("?")
         if path == "/": return self._serve_dashboard()
-        ctx = {"method": "GET", "path": path, "qs": qs, "headers": dict(self.headers)}
+        ctx = {"method": "GET", "path": path, "headers": dict(self.headers)}
         def _exec():
-            res = self._handle_get(path, qs)
+            res = self._handle_get(path, raw_qs)
             if isinstance(res, dict) and res.get("status") == 404:
                 if self._serve_static(path): return {"ok": True, "status": 200, "__static__": True}
             return res
-        resp = run_http_middlewares(ctx, self.middlewares, _exec)
+        self._send_result(run_http_middlewares(ctx, self.middlewares, _exec))
+
+    def do_POST(self):
+        with self._request_slots:
+            self._do_post()
+
+    def _do_post(self):
+        path = self.path.partition("?")[0]
+        # Always consume the body first so a rejected request doesn't desync the kept-alive stream;
+        # without a usable Content-Length the body can't be skipped, so the connection is closed.
+        raw_length = self.headers.get("Content-Length")
+        if raw_length is None:
+            if path == "/search-batch":
+                self.close_connection = True
+                return self._json({"ok": False, "error": "Content-Length required"}, status=411)
+            length = 0
+        else:
+            raw_length = raw_length.strip()
+            if not (raw_length.isascii() and raw_length.isdigit()):
+                self.close_connection = True
+                return self._json({"ok": False, "error": "invalid Content-Length"}, status=400)
+            length = int(raw_length)
+        if length > _BATCH_MAX_BODY:
+            self.close_connection = True
+            return self._json({"ok": False, "error": "request body too large"}, status=413)
+        raw = self.rfile.read(length) if length > 0 else b""
+        ctx = {"method": "POST", "path": path, "headers": dict(self.headers)}
+        def _exec():
+            if path != "/search-batch":
+                return {"ok": False, "error": "not found", "status": 404}
+            return self._route_search_batch(raw)
+        self._send_result(run_http_middlewares(ctx, self.middlewares, _exec))
+
+    def _send_result(self, resp):
         if isinstance(resp, dict) and resp.get("__static__"): return
+        if isinstance(resp, dict) and "__raw__" in resp:
+            return self._write_response(int(resp.get("status", 200)), _JSON_CTYPE, resp["__raw__"])
         if isinstance(resp, dict):
             status = int(resp.pop("status", 200))
             return self._json(resp, status=status)
         return self._json({"ok": False, "error": "invalid response"}, status=500)
 
-    def _handle_get(self, path, qs):
-        if path == "/health": return {"ok": True}
-        
-        # 1. RESTORED: Full status API with metrics
-        if path == "/status":
-            st = self.indexer.status
-            repo_stats = self.db.get_repo_stats(root_ids=self.root_ids)
-            sys_m = get_system_metrics()
-            sys_m["uptime"] = int(time.time() - self.start_time)
-            sys_m["db_size"] = self._get_db_size()
-            return {
-                "ok": True, "version": self.server_version, "index_ready": bool(st.index_ready),
-                "last_scan_ts": st.scan_finished_ts, "scanned_files": st.scanned_files,
-                "indexed_files": st.indexed_files, "repo_stats": repo_stats,
-                "roots": self.db.get_roots(), "system_metrics": sys_m
-            }
-
-        # 2. RESTORED: Search API
-        if path == "/search":
-            q = (qs.get("q") or [""])[0].strip()
-            if not q: return {"ok": False, "error": "missing q", "status": 400}
-            opts = SearchOptions(query=q, limit=int((qs.get("limit") or ["20"])[0]))
-            hits, meta = self.db.search_v2(opts)
-            return {"ok": True, "hits": [h.__dict__ for h in hits], "meta": meta}
-
-        # 3. RESTORED: Doctor, Graph, Candidates
-        if path == "/doctor":
-            from sari.core.health import SariDoctor
-            doc = SariDoctor(); doc.run_all()
-            return {"ok": True, "summary": doc.get_summary()}
-        if path == "/repo-candidates":
-            q = (qs.get("q") or [""])[0].strip()
-            return {"ok": True, "candidates": self.db.repo_candidates(q=q)}
-        if path == "/rescan":
-            self.indexer.status.index_ready = False
-            return {"ok": True, "requested": True}
-
-        return {"ok": False, "error": "not found", "status": 404}
+    def _handle_get(self, path, raw_qs=""):
+        route = self._ROUTES.get(path)
+        if route is None:
+            return {"ok": False, "error": "not found", "status": 404}
+        return route(self, raw_qs)
+
+    def _status_body(self) -> bytes:
+        cls = type(self)
+        with cls._status_lock:
+            ts, body = cls._status_cache
+            now = time.monotonic()
+            if body and now - ts < _STATUS_TTL_SEC:
+                return body
+            body = self._encode_status()
+            cls._status_cache = (now, body)
+            return body
+
+    def _route_health(self, raw_qs):
+        return {"ok": True, "status": 200, "__raw__": _HEALTH_BODY}
+
+    # 1. RESTORED: Full status API with metrics
+    def _route_status(self, raw_qs):
+        return {"ok": True, "status": 200, "__raw__": self._status_body()}
+
+    def _current_root_ids(self) -> tuple:
+        """root_ids for the indexer's workspace roots, recomputed only when the roots change."""
+        cfg = getattr(self.indexer, "cfg", None)
+        roots = tuple(getattr(cfg, "workspace_roots", None) or ())
+        cls = type(self)
+        if roots and roots != cls._root_ids_roots:
+            cls.root_ids = tuple(WorkspaceManager.root_id(r) for r in roots)
+            cls._root_ids_roots = roots
+        return cls.root_ids
+
+    def _encode_status(self) -> bytes:
+        st = self.indexer.status
+        repo_stats = self.db.get_repo_stats(root_ids=self._current_root_ids())
+        sys_m = get_system_metrics()
+        sys_m["uptime"] = int(time.time() - self.start_time)
+        sys_m["db_size"] = self._get_db_size()
+        # Fixed schema: scalars are formatted into the template, only nested values go through the encoder.
+        return _STATUS_TEMPLATE % (
+            self._version_json, b"true" if st.index_ready else b"false",
+            _json_bytes(st.scan_finished_ts), int(st.scanned_files or 0), int(st.indexed_files or 0),
+            _json_bytes(repo_stats), _json_bytes(self.db.get_roots()), _json_bytes(sys_m),
+        )
+
+    # 2. RESTORED: Search API
+    def _route_search(self, raw_qs):
+        # UIs poll /search before a query exists; reject that without parsing anything.
+        if "q=" not in raw_qs:
+            return {"ok": False, "status": 400, "__raw__": _MISSING_Q_BODY}
+        qs = _parse_qs_fast(raw_qs)
+        q = qs.get("q", "").strip()
+        if not q: return {"ok": False, "status": 400, "__raw__": _MISSING_Q_BODY}
+        limit = _qint(qs, "limit", 20, 1, _SEARCH_MAX_LIMIT)
+        commit_ts = self._last_commit_ts_fn
+        key = None
+        if commit_ts is not None and len(q) <= _SEARCH_CACHE_MAX_QUERY and limit <= _SEARCH_CACHE_MAX_LIMIT:
+            # A new commit changes the key; entries also expire so hits the engine hadn't published yet are refreshed.
+            key = (q, limit, commit_ts())
+            cls = type(self)
+            with cls._search_lock:
+                entry = cls._search_cache.get(key)
+                if entry is not None:
+                    if time.monotonic() - entry[0] < cls._search_cache_ttl:
+                        cls._search_cache.move_to_end(key)
+                        return {"ok": True, "status": 200, "__raw__": entry[1]}
+                    del cls._search_cache[key]
+        started = time.monotonic()
+        hits, meta = self._run_search(SearchOptions(query=q, limit=limit))
+        if key is None:
+            return {"ok": True, "hits": hits, "meta": meta}
+        body = _json_bytes({"ok": True, "hits": hits, "meta": meta})
+        with cls._search_lock:
+            cls._search_cache[key] = (started, body)
+            if len(cls._search_cache) > _SEARCH_CACHE_MAX:
+                cls._search_cache.popitem(last=False)
+        return {"ok": True, "status": 200, "__raw__": body}
+
+    # 3. RESTORED: Doctor, Graph, Candidates
+    def _route_doctor(self, raw_qs):
+        from sari.core.health import SariDoctor
+        doc = SariDoctor(); doc.run_all()
+        return {"ok": True, "summary": doc.get_summary()}
+
+    def _route_repo_candidates(self, raw_qs):
+        qs = _parse_qs_fast(raw_qs)
+        q = qs.get("q", "").strip()
+        return {"ok": True, "candidates": self.db.repo_candidates(q=q, limit=_qint(qs, "limit", 3, 1, 20))}
+
+    def _route_rescan(self, raw_qs):
+        self.indexer.status.index_ready = False
+        type(self)._status_cache = (0.0, b"")
+        return {"ok": True, "requested": True}
+
+    def _route_search_batch(self, raw: bytes):
+        try:
+            queries = _json_loads(raw) if raw else None
+        except ValueError:
+            return {"ok": False, "error": "invalid json", "status": 400}
+        if isinstance(queries, dict):
+            queries = queries.get("queries")
+        if not isinstance(queries, list):
+            return {"ok": False, "error": "expected a list of queries", "status": 400}
+        if len(queries) > _BATCH_MAX_QUERIES:
+            return {"ok": False, "error": f"at most {_BATCH_MAX_QUERIES} queries per batch", "status": 400}
+        # Submit everything first so the batcher can coalesce duplicates within the request.
+        pending = []
+        for item in queries:
+            q = str((item or {}).get("q") or "").strip() if isinstance(item, dict) else ""
+            if not q:
+                pending.append("missing q")
+                continue
+            try:
+                opts = SearchOptions(query=q, limit=_qint(item, "limit", 20, 1, _SEARCH_MAX_LIMIT), repo=item.get("repo") or None)
+                pending.append(self._search_batcher.submit(opts) if self._search_batcher else opts)
+            except Exception as e:
+                pending.append(str(e))
+        results = []
+        for p in pending:
+            if isinstance(p, str):
+                results.append({"ok": False, "error": p})
+                continue
+            try:
+                hits, meta = p.result(timeout=_SEARCH_TIMEOUT_SEC) if isinstance(p, Future) else self.db.search_v2(p)
+                results.append({"ok": True, "hits": hits, "meta": meta})
+            except Exception as e:
+                results.append({"ok": False, "error": str(e)})
+        return {"ok": True, "results": results}
+
+    def _run_search(self, opts: SearchOptions):
+        if self._search_batcher is not None:
+            return self._search_batcher.search(opts)
+        return self.db.search_v2(opts)
+
+    _ROUTES = {
+        "/health": _route_health,
+        "/status": _route_status,
+        "/search": _route_search,
+        "/doctor": _route_doctor,
+        "/repo-candidates": _route_repo_candidates,
+        "/rescan": _route_rescan,
+    }
 
     def _serve_dashboard(self):
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.end_headers()
-        self.wfile.write(self._get_dashboard_html().encode("utf-8"))
+        self._write_response(200, "text/html; charset=utf-8", self._get_dashboard_html().encode("utf-8"))
 
     def _get_dashboard_html(self):
         # ... (Dashboard HTML code kept as previously implemented) ...
@@ -193,21 +501,180 @@ class Handler(BaseHTTPRequestHandler):
         if not file_path.startswith(os.path.abspath(static_root)): return False
         if os.path.exists(file_path) and os.path.isfile(file_path):
             try:
-                self.send_response(200)
                 ctype, _ = mimetypes.guess_type(file_path)
-                self.send_header("Content-Type", ctype or "application/octet-stream")
                 with open(file_path, "rb") as f: content = f.read()
-                self.send_header("Content-Length", str(len(content))); self.end_headers()
-                self.wfile.write(content)
+                self._write_response(200, ctype or "application/octet-stream", content)
                 return True
             except: return False
         return False
 
-def serve_forever(host: str, port: int, db: LocalSearchDB, indexer: Indexer, version: str = "dev", workspace_root: str = "", cfg=None, mcp_server=None) -> tuple:
+class SearchBatcher:
+    """
+    Coalesces identical /search work: while a (q, limit, repo) search is running, callers
+    asking for the same one wait on its result instead of running it again. Distinct
+    searches run concurrently, inline on the request thread for search() and on a pool
+    of workers for submit().
+    """
+
+    def __init__(self, search_fn, workers: int = 2):
+        self._search = search_fn
+        self._lock = threading.Lock()
+        self._inflight: Dict[tuple, Future] = {}
+        self._pending: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._workers = [
+            threading.Thread(target=self._run, name=f"sari-search-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for t in self._workers:
+            t.start()
+
+    def submit(self, opts: SearchOptions) -> Future:
+        fut, owner = self._claim(opts)
+        if owner:
+            self._pending.put((opts, fut))
+        return fut
+
+    def search(self, opts: SearchOptions):
+        fut, owner = self._claim(opts)
+        if owner:
+            self._execute(opts, fut)
+        return fut.result(timeout=_SEARCH_TIMEOUT_SEC)
+
+    def close(self) -> None:
+        """Stop the workers once they finish the searches already queued."""
+        workers, self._workers = self._workers, []
+        for _ in workers:
+            self._pending.put(None)
+
+    def _claim(self, opts: SearchOptions):
+        key = (opts.query, opts.limit, opts.repo)
+        with self._lock:
+            fut = self._inflight.get(key)
+            if fut is not None:
+                return fut, False
+            fut = self._inflight[key] = Future()
+            return fut, True
+
+    def _execute(self, opts: SearchOptions, fut: Future) -> None:
+        try:
+            res, err = self._search(opts), None
+        except Exception as e:
+            res, err = None, e
+        finally:
+            # Released before the result is published, so later callers start a fresh search.
+            with self._lock:
+                self._inflight.pop((opts.query, opts.limit, opts.repo), None)
+        if err is not None:
+            fut.set_exception(err)
+        else:
+            fut.set_result(res)
+
+    def _run(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            self._execute(*item)
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """Connections are handled by a fixed set of reused daemon workers instead of one new thread each."""
+    # socketserver's default backlog of 5 drops connects under bursty polling.
+    request_queue_size = 1024
+    # Idle keep-alive connections release their worker after this long (just over the dashboard's 2s poll).
+    keepalive_timeout = 2.5
+
+    def __init__(self, *args, max_workers: int = 0, reuse_port: bool = False,
+                 share_with: "Optional[PooledHTTPServer]" = None, **kwargs):
+        self.reuse_port = reuse_port
+        super().__init__(*args, **kwargs)
+        self._siblings: List["PooledHTTPServer"] = []
+        if share_with is not None:
+            # Extra SO_REUSEPORT listener: accepts on its own socket, hands off to the shared workers.
+            self._pending = share_with._pending
+            self._open_requests = share_with._open_requests
+            self._open_lock = share_with._open_lock
+            self._workers = []
+            share_with._siblings.append(self)
+            return
+        self._pending: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._open_requests = set()
+        self._open_lock = threading.Lock()
+        # Daemon workers (unlike ThreadPoolExecutor's) never hold up interpreter exit on an idle keep-alive socket.
+        self._workers = [
+            threading.Thread(target=self._work, name=f"sari-http-{i}", daemon=True)
+            for i in range(max_workers or min(32, (os.cpu_count() or 1) * 4))
+        ]
+        for t in self._workers:
+            t.start()
+
+    def server_bind(self):
+        if self.reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def _work(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            self.process_request_thread(*item)
+
+    def process_request(self, request, client_address):
+        with self._open_lock:
+            self._open_requests.add(request)
+        self._pending.put((request, client_address))
+
+    def shutdown_request(self, request):
+        with self._open_lock:
+            self._open_requests.discard(request)
+        super().shutdown_request(request)
+
+    def shutdown(self):
+        for sib in self._siblings:
+            sib.shutdown()
+        super().shutdown()
+
+    def server_close(self):
+        for sib in self._siblings:
+            sib.server_close()
+        super().server_close()
+        if not self._workers:
+            return
+        with self._open_lock:
+            pending = list(self._open_requests)
+        for request in pending:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        for _ in self._workers:
+            self._pending.put(None)
+        batcher = getattr(self.RequestHandlerClass, "_search_batcher", None)
+        if batcher is not None:
+            batcher.close()
+
+def serve_forever(host: str, port: int, db: "LocalSearchDB", indexer: "Indexer", version: str = "dev", workspace_root: str = "", cfg=None, mcp_server=None) -> tuple:
     import socket
     class BoundHandler(Handler): pass
     BoundHandler.db, BoundHandler.indexer, BoundHandler.server_host, BoundHandler.server_version, BoundHandler.mcp_server = db, indexer, host, version, mcp_server
-    httpd = ThreadingHTTPServer((host, port), BoundHandler)
+    listeners = max(1, settings.get_int("HTTP_LISTENERS", 1)) if hasattr(socket, "SO_REUSEPORT") else 1
+    concurrency = max(1, settings.get_int("HTTP_MAX_CONCURRENCY", 16))
+    # Workers parked on idle keep-alive sockets hold no request slot, so the pool outnumbers the slots.
+    httpd = PooledHTTPServer((host, port), BoundHandler, reuse_port=listeners > 1, max_workers=concurrency * 2)
+    BoundHandler._search_cache = OrderedDict()
+    BoundHandler._search_cache_ttl = _SEARCH_CACHE_TTL_SEC + max(0, int(settings.ENGINE_RELOAD_MS or 0)) / 1000.0
+    BoundHandler._db_path = getattr(db, "db_path", None)
+    BoundHandler._version_json = _json_bytes(version)
+    BoundHandler._last_commit_ts_fn = getattr(indexer, "get_last_commit_ts", None)
+    if hasattr(db, "search_v2"):
+        # Batch queries fan out over as many workers as handlers may run at once.
+        BoundHandler._search_batcher = SearchBatcher(db.search_v2, workers=concurrency)
+    BoundHandler._request_slots = threading.BoundedSemaphore(concurrency)
     actual_port = httpd.server_address[1]
+    # Extra listeners share the kernel's SO_REUSEPORT balancing; shutdown/close on httpd covers them.
+    for _ in range(listeners - 1):
+        extra = PooledHTTPServer((host, actual_port), BoundHandler, reuse_port=True, share_with=httpd)
+        threading.Thread(target=extra.serve_forever, daemon=True).start()
     threading.Thread(target=httpd.serve_forever, daemon=True).start()
     return httpd, actual_port
\ No newline at end of file
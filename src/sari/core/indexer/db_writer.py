@@ -1,26 +1,44 @@
-import queue
 import threading
 import logging
 import time
-from typing import List, Dict, Any
+from collections import deque
+from typing import Dict, Any, Sequence
 
 logger = logging.getLogger("sari.db_writer")
 
+_MAX_PENDING = 2000
+
 class DBWriter:
-    def __init__(self, db):
+    def __init__(self, db, max_batch: int = 100):
         self.db = db
-        self.queue = queue.Queue(maxsize=2000)
+        self.max_batch = max(1, int(max_batch))
+        # Tasks go into a deque under one condition; the writer thread takes
+        # everything available (up to max_batch) per lock round-trip.
+        self._buf = deque()
+        self._cond = threading.Condition()
+        self._pending = 0  # enqueued but not yet flushed
+        # Wall-clock time of the last successful flush/finalize; readers key caches on it.
+        self.last_commit_ts = 0.0
         self._stop_event = threading.Event()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     def enqueue(self, task: Dict[str, Any]):
-        self.queue.put(task)
+        with self._cond:
+            while len(self._buf) >= _MAX_PENDING:
+                self._cond.wait()
+            self._buf.append(task)
+            self._pending += 1
+            self._cond.notify_all()
+
+    def qsize(self) -> int:
+        return len(self._buf)
 
     def finalize(self):
         """Block until all tasks are processed and committed to search engine."""
-        while not self.queue.empty():
-            time.sleep(0.1)
+        with self._cond:
+            while self._pending:
+                self._cond.wait()
         
         # Priority Fix: Explicitly commit to SQLite and Search Engine
         self.db.finalize_turbo_batch()
@@ -31,35 +49,68 @@ class DBWriter:
                 logger.debug("Tantivy engine committed successfully.")
             except Exception as e:
                 logger.error(f"Failed to commit Tantivy: {e}")
+        self.last_commit_ts = time.time()
+
+    def _drain_batch(self) -> Sequence[Dict[str, Any]]:
+        with self._cond:
+            while not self._buf and not self._stop_event.is_set():
+                self._cond.wait(0.5)
+            buf = self._buf
+            if len(buf) <= self.max_batch:
+                # Hand the whole deque to the flush and start a fresh one.
+                batch = buf
+                self._buf = deque()
+            else:
+                batch = [buf.popleft() for _ in range(self.max_batch)]
+            if batch:
+                self._cond.notify_all()
+            return batch
 
     def _run(self):
-        batch = []
-        last_flush = time.time()
-        
-        while not self._stop_event.is_set() or not self.queue.empty():
-            try:
-                task = self.queue.get(timeout=0.5)
-                batch.append(task)
-            except queue.Empty:
-                if batch: self._flush(batch); batch = []
+        # Tasks that arrive while a flush is running are picked up together
+        # by the next drain, so batches grow with load.
+        while True:
+            batch = self._drain_batch()
+            if not batch:
+                if self._stop_event.is_set():
+                    break
                 continue
-
-            if len(batch) >= 100 or (time.time() - last_flush > 2.0):
+            try:
                 self._flush(batch)
-                batch = []
-                last_flush = time.time()
+            finally:
+                with self._cond:
+                    self._pending -= len(batch)
+                    self._cond.notify_all()
 
-    def _flush(self, batch: List[Dict[str, Any]]):
+    def _flush(self, batch: Sequence[Dict[str, Any]]):
+        if not batch:
+            return
         try:
+            # Unchanged files only need their last-seen stamp; rewriting the
+            # row would clobber the stored content with an empty one.
+            changed = [t for t in batch if t.get("type") != "unchanged"]
+            if len(changed) < len(batch) and hasattr(self.db, "update_last_seen"):
+                seen_ts = max(t.get("scan_ts", 0) for t in batch)
+                unchanged = [t for t in batch if t.get("type") == "unchanged"]
+                # Hash-equal files carry a new mtime/size that the row must pick up.
+                restat = [(t["rel"], t["mtime"], t["size"]) for t in unchanged if "mtime" in t]
+                if restat and hasattr(self.db, "update_file_stats"):
+                    self.db.update_file_stats(restat, seen_ts)
+                    self.db.update_last_seen([t["rel"] for t in unchanged if "mtime" not in t], seen_ts)
+                else:
+                    self.db.update_last_seen([t["rel"] for t in unchanged], seen_ts)
             # Batch upsert to SQLite
-            self.db.upsert_files_turbo(batch)
+            self.db.upsert_files_turbo(changed)
             # Sync to Search Engine
             if hasattr(self.db, "engine") and self.db.engine:
-                docs = [t["engine_doc"] for t in batch if "engine_doc" in t]
+                docs = [t["engine_doc"] for t in changed if "engine_doc" in t]
                 if docs: self.db.engine.add_documents(docs)
+            self.last_commit_ts = time.time()
         except Exception as e:
             logger.error(f"Flush error: {e}")
 
     def stop(self):
         self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
         self._thread.join()
\ No newline at end of file
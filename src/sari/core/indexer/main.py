@@ -1,13 +1,39 @@
+import os
 import time
 import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
+from sari.core.settings import settings
 from sari.core.indexer.scanner import Scanner
-from sari.core.indexer.worker import IndexWorker
+from sari.core.indexer.worker import IndexWorker, _init_child_worker, _process_files_in_child
 from sari.core.indexer.db_writer import DBWriter
 
 logger = logging.getLogger("sari.indexer")
 
+# Below this many files a process pool costs more to start than it saves.
+_PARALLEL_MIN_FILES = 256
+_PARSE_CHUNKSIZE = 32
+# Chunks submitted ahead per parse process.
+_PARSE_CHUNKS_IN_FLIGHT = 2
+
+
+def _pool_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _chunks(items: Iterable[Tuple], size: int) -> Iterator[List[Tuple]]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
 class Indexer:
     def __init__(self, cfg, db):
         self.cfg = cfg
@@ -24,22 +50,78 @@ class Indexer:
         # 1. Preload metadata to avoid N+1 queries
         self.db.preload_metadata()
         
-        # 2. Scan and process
-        for root_id, root_path in self.scanner.get_active_roots():
-            for file_path, st in self.scanner.walk(root_path):
-                res = self.worker.process_file_task(
-                    Path(root_path), Path(file_path), st, start_ts, time.time(), False, root_id=root_id
-                )
-                if res:
-                    self.writer.enqueue(res)
+        # 2. Scan and process. The walk is streamed; only a bounded look-ahead
+        # is buffered to decide between the serial path and the parse pool.
+        tasks = self._iter_tasks(start_ts)
+        head = list(islice(tasks, _PARALLEL_MIN_FILES))
+        if self._parse_processes(len(head)) > 1:
+            # Settle stat-unchanged files here so only candidates are shipped
+            # to (and pickled back from) the parse pool.
+            tasks = (task for task in chain(head, tasks) if not self._settle_unchanged(task))
+            head = list(islice(tasks, _PARALLEL_MIN_FILES))
+        tasks = chain(head, tasks)
+        processes = self._parse_processes(len(head))
+        if processes > 1:
+            results = self._parse_files_parallel(tasks, processes)
+        else:
+            results = (
+                self.worker.process_file_task(root, path, st, ts, now, excluded, root_id=root_id)
+                for root, path, st, ts, now, excluded, root_id in tasks
+            )
+        for res in results:
+            if res:
+                self.writer.enqueue(res)
         
         # 3. CRITICAL: Finalize all batches (DB + Search Engine)
         self.writer.finalize()
+        # The snapshot is only valid for this scan; watcher updates must see the rows just written.
+        self.db.clear_metadata()
         
         # 4. Prune stale records
         self.db.prune_stale_files(start_ts)
         logger.info("✅ Scan complete and synchronized.")
 
+    def _iter_tasks(self, start_ts: int) -> Iterator[Tuple]:
+        for root_id, root_path in self.scanner.get_active_roots():
+            root = Path(root_path)
+            for file_path, st in self.scanner.walk(root):
+                yield (root, file_path, st, start_ts, time.time(), False, root_id)
+
+    def _settle_unchanged(self, task: Tuple) -> bool:
+        root, path, st, ts, _, _, root_id = task
+        res = self.worker.unchanged_result(root, path, st, ts, root_id=root_id)
+        if res:
+            self.writer.enqueue(res)
+        return bool(res)
+
+    def _parse_processes(self, n_files: int) -> int:
+        if n_files < _PARALLEL_MIN_FILES:
+            return 1
+        n = settings.get_int("INDEX_PROCESSES", 0)
+        return n if n > 0 else (os.cpu_count() or 1)
+
+    def _parse_files_parallel(self, tasks: Iterable[Tuple], processes: int):
+        """Read and parse files in worker processes (parsing is CPU-bound and
+        GIL-limited); results come back in order and are written from here.
+        Chunks are submitted as results are consumed, so at most a few chunks
+        per process are in flight and the walk is never materialized."""
+        file_meta = getattr(self.db, "_file_meta", None)
+        if not isinstance(file_meta, dict):
+            file_meta = None
+        in_flight = deque()
+        # The parent runs writer/watcher threads; forking it could copy a held lock into a child.
+        with ProcessPoolExecutor(max_workers=processes, mp_context=_pool_context(),
+                                 initializer=_init_child_worker, initargs=(self.cfg, file_meta)) as pool:
+            for chunk in _chunks(tasks, _PARSE_CHUNKSIZE):
+                in_flight.append(pool.submit(_process_files_in_child, chunk))
+                if len(in_flight) >= processes * _PARSE_CHUNKS_IN_FLIGHT:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+
+    def get_last_commit_ts(self) -> float:
+        return self.writer.last_commit_ts
+
     def start_watching(self):
         """Future: Real-time watchdog integration"""
         pass
\ No newline at end of file
@@ -1,8 +1,9 @@
 import fnmatch
 import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Tuple, Optional
+from typing import Callable, Iterable, List, Tuple, Optional
 from sari.core.utils.gitignore import GitignoreMatcher
 from sari.core.utils.path_trie import PathTrie
 
@@ -12,6 +13,7 @@ class Scanner:
         from sari.core.settings import settings as global_settings
         self.settings = getattr(self.cfg, "settings", None) or global_settings
         self.max_depth = self.settings.MAX_DEPTH
+        self.scan_threads = int(getattr(self.settings, "SCAN_THREADS", 1) or 1)
         
         # 1. Hardcoded Directory Excludes (Exact Match)
         self.hard_exclude_dirs = {
@@ -30,6 +32,10 @@ class Scanner:
         self.include_ext = {e.lower() for e in getattr(self.cfg, "include_ext", [])}
         self.include_files = set(getattr(self.cfg, "include_files", []))
         self.include_all = not self.include_ext and not self.include_files
+        # fnmatch.fnmatch semantics (normcase'd, no brace expansion) as one regex
+        self.include_files_regex = re.compile(
+            "|".join(fnmatch.translate(os.path.normcase(p)) for p in self.include_files)
+        ) if self.include_files else None
         self.follow_symlinks = getattr(self.cfg.settings, "FOLLOW_SYMLINKS", False)
 
         # O(1) match optimization
@@ -79,92 +85,127 @@ class Scanner:
             regex_parts.append(fnmatch.translate(pat))
         return re.compile("|".join(regex_parts))
 
+    def walk(self, root) -> Iterable[Tuple[Path, os.stat_result]]:
+        """Indexable files under root with the stat scandir already cached,
+        so the indexer never re-stats what the walk has seen."""
+        for path, st, _ in self.iter_file_entries(Path(root)):
+            yield path, st
+
     def iter_file_entries(self, root: Path, apply_exclude: bool = True) -> Iterable[Tuple[Path, os.stat_result, bool]]:
-        yield from self._scan_recursive(root, root, depth=0, follow_symlinks=self.follow_symlinks, apply_exclude=apply_exclude, visited=set())
+        gitignore_lines = list(getattr(self.cfg, "gitignore_lines", []))
+        gitignore = GitignoreMatcher(gitignore_lines) if gitignore_lines else None
+        # Symlink cycle detection shares one visited set, so only plain walks fan out.
+        if self.scan_threads > 1 and not self.follow_symlinks:
+            yield from self._scan_tree_threaded(root, apply_exclude, gitignore)
+        else:
+            yield from self._scan_tree(root, self.follow_symlinks, apply_exclude, gitignore)
 
-    def _scan_recursive(self, root: Path, current_dir: Path, depth: int, follow_symlinks: bool, apply_exclude: bool, visited: set) -> Iterable[Tuple[Path, os.stat_result, bool]]:
-        if depth > self.max_depth:
-            return
+    def _scan_tree_threaded(self, root: Path, apply_exclude: bool, gitignore: Optional[GitignoreMatcher]) -> Iterable[Tuple[Path, os.stat_result, bool]]:
+        """Walk each top-level directory on a thread pool. scandir/stat release
+        the GIL, so slow or networked filesystems get more than one request in
+        flight; output order matches the single-threaded walk."""
+        def walk_subtree(path: str, in_excluded_dir: bool) -> List[Tuple[Path, os.stat_result, bool]]:
+            return list(self._scan_tree(root, False, apply_exclude, gitignore, start=(path, 1, in_excluded_dir)))
 
-        # 1. Skip sub-directories managed by another ACTIVE workspace.
-        # Boundary is registry/trie-driven, not marker-file driven.
-        if current_dir != root:
-            if self.workspace_trie.is_path_owned_by_sub_workspace(str(current_dir), str(root)):
-                return
+        with ThreadPoolExecutor(max_workers=self.scan_threads, thread_name_prefix="sari-scan") as pool:
+            # The top level is listed (and every subtree submitted) up front;
+            # subtree results are then spliced in where the directory was.
+            top = list(self._scan_tree(root, False, apply_exclude, gitignore,
+                                       spawn=lambda path, excluded: pool.submit(walk_subtree, path, excluded)))
+            for item in top:
+                if isinstance(item, Future):
+                    yield from item.result()
+                else:
+                    yield item
 
-        # Cycle detection for symlinks
-        if follow_symlinks:
-            try:
-                real_path = str(current_dir.resolve())
+    def _scan_tree(self, root: Path, follow_symlinks: bool, apply_exclude: bool, gitignore: Optional[GitignoreMatcher],
+                   start: Optional[Tuple[str, int, bool]] = None,
+                   spawn: Optional[Callable[[str, bool], Future]] = None) -> Iterable:
+        # Depth-first over a stack of open directory iterators, so entries come
+        # out in the same order as a recursive walk without nested generators.
+        # Everything stays a str until a file is yielded: rel paths are sliced
+        # off the root prefix and DirEntry caches its stat.
+        # start resumes the walk at a subdirectory; with spawn, top-level
+        # directories are handed off and their Future yielded in place.
+        root_str = str(root)
+        prefix_len = len(root_str) if root_str.endswith(os.sep) else len(root_str) + 1
+        visited = set()
+        stack = []
+
+        def enter(current_dir: str, depth: int, in_excluded_dir: bool) -> None:
+            if depth > self.max_depth:
+                return
+            # 1. Skip sub-directories managed by another ACTIVE workspace.
+            # Boundary is registry/trie-driven, not marker-file driven.
+            if depth and self.workspace_trie.is_path_owned_by_sub_workspace(current_dir, root_str):
+                return
+            # Cycle detection for symlinks
+            if follow_symlinks:
+                try:
+                    real_path = os.path.realpath(current_dir)
+                except (PermissionError, OSError):
+                    return
                 if real_path in visited:
                     return
                 visited.add(real_path)
+            try:
+                entries = list(os.scandir(current_dir))
             except (PermissionError, OSError):
                 return
+            stack.append((iter(entries), depth, in_excluded_dir))
 
-        # gitignore check
-        gitignore_lines = list(getattr(self.cfg, "gitignore_lines", []))
-        gitignore = GitignoreMatcher(gitignore_lines) if gitignore_lines else None
+        dir_regex = self.exclude_dir_regex
+        glob_regex = self.exclude_glob_regex
+        include_files_regex = self.include_files_regex
+        enter(*(start or (root_str, 0, False)))
+        while stack:
+            entries, depth, in_excluded_dir = stack[-1]
+            for entry in entries:
+                rel = entry.path[prefix_len:]
+                name = entry.name
 
-        try:
-            entries = list(os.scandir(current_dir))
-        except (PermissionError, OSError):
-            return
-
-        for entry in entries:
-            try:
-                p = Path(entry.path)
-                rel = str(p.absolute().relative_to(root))
-            except:
-                continue
-
-            if entry.is_dir(follow_symlinks=follow_symlinks):
-                # Directory processing
-                d_name = entry.name
-                if apply_exclude:
-                    if self.exclude_dir_regex and (self.exclude_dir_regex.match(d_name) or self.exclude_dir_regex.match(rel)):
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    dir_excluded = bool(dir_regex and dir_regex.match(name))
+                    if apply_exclude:
+                        if dir_excluded or (dir_regex and dir_regex.match(rel)):
+                            continue
+                        if gitignore and gitignore.is_ignored(rel.replace(os.sep, "/"), is_dir=True):
+                            continue
+                    if spawn is not None and depth == 0:
+                        if depth + 1 <= self.max_depth:
+                            yield spawn(entry.path, in_excluded_dir or dir_excluded)
                         continue
-                    if gitignore and gitignore.is_ignored(rel.replace(os.sep, "/"), is_dir=True):
-                        continue
-                
-                yield from self._scan_recursive(root, p, depth + 1, follow_symlinks, apply_exclude, visited)
-            
-            elif entry.is_file(follow_symlinks=follow_symlinks):
-                # File processing
-                fn = entry.name
-                excluded = False
-                if self.exclude_glob_regex and (self.exclude_glob_regex.match(fn) or self.exclude_glob_regex.match(rel)):
+                    enter(entry.path, depth + 1, in_excluded_dir or dir_excluded)
+                    break  # descend; this frame resumes after the subtree
+
+                if not entry.is_file(follow_symlinks=follow_symlinks):
+                    continue
+                excluded = bool(glob_regex and (glob_regex.match(name) or glob_regex.match(rel)))
+                if not excluded and gitignore and gitignore.is_ignored(rel.replace(os.sep, "/"), is_dir=False):
                     excluded = True
-                
-                if not excluded and gitignore:
-                    rel_posix = rel.replace(os.sep, "/")
-                    if gitignore.is_ignored(rel_posix, is_dir=False):
-                        excluded = True
-                
-                if not excluded and self.exclude_dir_regex:
-                    rel_parts = rel.split(os.sep)
-                    for part in rel_parts:
-                        if self.exclude_dir_regex.match(part):
-                            excluded = True
-                            break
-                
+                # Any path component (ancestor dirs or the file name itself)
+                # matching an excluded dir name excludes the file.
+                if not excluded and (in_excluded_dir or (dir_regex and dir_regex.match(name))):
+                    excluded = True
+                if apply_exclude and excluded:
+                    continue
+
                 try: st = entry.stat(follow_symlinks=follow_symlinks)
                 except: continue
 
                 # Include filter
                 if not self.include_all:
-                    rel_posix = rel.replace(os.sep, "/")
-                    ext = p.suffix.lower()
                     included = False
-                    if self.include_files:
-                        for pattern in self.include_files:
-                            if fnmatch.fnmatch(fn, pattern) or fnmatch.fnmatch(rel_posix, pattern):
-                                included = True
-                                break
-                    if not included and self.include_ext and ext in self.include_ext:
-                        included = True
+                    if include_files_regex:
+                        included = bool(include_files_regex.match(os.path.normcase(name))
+                                        or include_files_regex.match(os.path.normcase(rel.replace(os.sep, "/"))))
+                    if not included and self.include_ext:
+                        dot = name.rfind(".")  # Path.suffix semantics
+                        ext = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+                        included = ext in self.include_ext
                     if not included:
                         continue
 
-                if apply_exclude and excluded: continue
-                yield p, st, excluded
+                yield Path(entry.path), st, excluded
+            else:
+                stack.pop()
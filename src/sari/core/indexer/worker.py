@@ -12,9 +12,51 @@ from sari.core.parsers.ast_engine import ASTEngine
 import hashlib
 import zlib
 from sari.core.utils import _redact, _sample_file, _printable_ratio, _is_minified, _normalize_engine_text
+from sari.core.utils.file import _TEXT_SAMPLE_BYTES
+
+try:
+    from blake3 import blake3 as _blake3
+except Exception:
+    _blake3 = None
+
+# Bump when parser/AST extraction output changes so memoized results are not reused.
+_PARSE_CACHE_VERSION = 1
+
+def _digest(data: bytes) -> str:
+    # Change-detection fingerprint only (not an identity), so a 128-bit
+    # blake3 digest is enough when installed; sha1 is the fallback since it
+    # is hardware-accelerated on most CPUs and outruns blake2b/sha256.
+    if _blake3 is not None:
+        return _blake3(data).hexdigest(16)
+    return hashlib.sha1(data).hexdigest()
 
 def compute_hash(content: str) -> str:
-    return hashlib.sha1(content.encode("utf-8", errors="ignore")).hexdigest()
+    return _digest(content.encode("utf-8", errors="ignore"))
+
+def _read_source(file_path: Path, size: int) -> bytes:
+    """Raw file bytes from a single unbuffered read sized from the scan's stat
+    instead of TextIOWrapper chunking."""
+    with open(file_path, "rb", buffering=0) as f:
+        data = f.read(size + 1)
+        if len(data) > size:  # grew since stat
+            data += f.readall()
+    return data
+
+
+def _decode_source(data: bytes) -> str:
+    """Path.read_text(errors="ignore") equivalent for bytes already read."""
+    text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:  # universal newlines, as text mode would do
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _text_sample(data: bytes) -> bytes:
+    # Head and tail of the file, as _sample_file would read them from disk.
+    if len(data) <= 2 * _TEXT_SAMPLE_BYTES:
+        return data
+    return data[:_TEXT_SAMPLE_BYTES] + data[-_TEXT_SAMPLE_BYTES:]
+
 
 def compute_fast_signature(file_path: Path, size: int) -> str:
     try:
@@ -24,7 +66,7 @@ def compute_fast_signature(file_path: Path, size: int) -> str:
             header = f.read(4096)
             f.seek(-4096, 2)
             footer = f.read(4096)
-            return hashlib.sha1(header + footer + str(size).encode()).hexdigest()
+            return _digest(header + footer + str(size).encode())
     except Exception: return ""
 
 class IndexWorker:
@@ -40,31 +82,25 @@ class IndexWorker:
         self._git_top_level_cache = {}
 
     def process_file_task(self, root: Path, file_path: Path, st: os.stat_result, scan_ts: int, now: float, excluded: bool, root_id: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
-        # Priority Check: File existence (Required for D2 resilience test)
-        if not file_path.exists(): return None
-
+        # A file that vanished since the scan surfaces as FileNotFoundError
+        # on read below (D2 resilience test expects None).
         db_path = "unknown"
         repo = "unknown"
         try:
-            rel_to_root = str(file_path.relative_to(root))
-            db_path = self._encode_db_path(root, file_path, root_id=root_id)
-            repo = self._derive_repo_label(root, file_path, rel_to_root)
+            rel_to_root, db_path, repo = self._file_identity(root, file_path, root_id)
             ext = file_path.suffix.lower()
 
             # 1. Fast Metadata Check (Safe fallback for mocks in tests)
-            prev = None
-            if hasattr(self.db, "get_file_meta"):
-                prev = self.db.get_file_meta(db_path)
-            
-            if not force and prev and int(st.st_mtime) == int(prev[0]) and int(st.st_size) == int(prev[1]):
-                return {"type": "unchanged", "rel": db_path, "repo": repo}
+            prev = self._file_meta(db_path)
+            if not force and self._stat_matches(prev, st):
+                return {"type": "unchanged", "rel": db_path, "repo": repo, "scan_ts": scan_ts}
 
             size = st.st_size
             if size > self.settings.MAX_PARSE_BYTES:
                 return self._skip_result(db_path, repo, st, scan_ts, "too_large")
 
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            if not content:
+            data = _read_source(file_path, size)
+            if not data:
                 return self._skip_result(db_path, repo, st, scan_ts, "empty")
         except FileNotFoundError:
             # Priority Requirement: D2 resilience test expects None when file disappears
@@ -77,13 +113,20 @@ class IndexWorker:
             }
 
         try:
-            if not _printable_ratio(content):
+            # The binary check runs on raw bytes; "weak" decoding tolerates a
+            # multi-byte character split at the sample's head/tail cut.
+            if not _printable_ratio(_text_sample(data), policy="weak"):
                 return self._skip_result(db_path, repo, st, scan_ts, "binary")
-            
-            is_mini = _is_minified(content)
+            content = _decode_source(data)
+            if not content:
+                return self._skip_result(db_path, repo, st, scan_ts, "empty")
+
+            is_mini = _is_minified(file_path, content[:_TEXT_SAMPLE_BYTES])
             current_hash = compute_hash(content)
             if not force and prev and prev[2] == current_hash:
-                return {"type": "unchanged", "rel": db_path, "repo": repo}
+                # Same content under a new stat: carry mtime/size so the row's stat check matches next scan.
+                return {"type": "unchanged", "rel": db_path, "repo": repo, "scan_ts": scan_ts,
+                        "mtime": int(st.st_mtime), "size": size}
 
             if self.settings.get_bool("REDACT_ENABLED", True):
                 content = _redact(content)
@@ -103,22 +146,7 @@ class IndexWorker:
             ast_status, ast_reason = "skipped", ("minified" if is_mini else "none")
             
             if size <= self.settings.MAX_AST_BYTES and not is_mini:
-                if self.extractor_cb:
-                    try:
-                        res = self.extractor_cb(db_path, content)
-                        if isinstance(res, tuple): symbols, relations = res
-                    except: pass
-                
-                lang = ParserFactory.get_language(ext)
-                if lang and self.ast_engine.enabled:
-                    tree = self.ast_engine.parse(lang, content)
-                    if tree:
-                        ast_status, ast_reason = "ok", "none"
-                        try:
-                            ts_symbols, _ = self.ast_engine.extract_symbols(db_path, lang, content, tree=tree)
-                            if ts_symbols: symbols = self._merge_symbols(symbols, ts_symbols)
-                        except: pass
-                    else: ast_status, ast_reason = "failed", "parse_error"
+                symbols, relations, ast_status, ast_reason = self._extract_cached(db_path, ext, content, current_hash)
 
             store_content = getattr(self.cfg, "store_content", True)
             stored_content = content if store_content else ""
@@ -145,6 +173,77 @@ class IndexWorker:
                 "ast_status": "failed", "ast_reason": str(e)
             }
 
+    def unchanged_result(self, root: Path, file_path: Path, st: os.stat_result, scan_ts: int, root_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """The "unchanged" result if mtime and size match the stored row, else
+        None; lets the indexer settle steady-state files without a parse worker."""
+        try:
+            _, db_path, repo = self._file_identity(root, file_path, root_id)
+        except Exception:
+            return None
+        if not self._stat_matches(self._file_meta(db_path), st):
+            return None
+        return {"type": "unchanged", "rel": db_path, "repo": repo, "scan_ts": scan_ts}
+
+    def _file_identity(self, root: Path, file_path: Path, root_id: Optional[str]) -> Tuple[str, str, str]:
+        # Slicing the string is ~10x cheaper than PurePath.relative_to; anything
+        # that isn't a plain prefix match (e.g. case differences) takes the
+        # relative_to path, which also raises for files outside root.
+        root_str = str(root)
+        path_str = str(file_path)
+        prefix_len = len(root_str) if root_str.endswith(os.sep) else len(root_str) + 1
+        if path_str.startswith(root_str) and path_str[prefix_len - 1:prefix_len] == os.sep and len(path_str) > prefix_len:
+            rel_to_root = path_str[prefix_len:]
+        else:
+            rel_to_root = str(file_path.relative_to(root))
+        rel_posix = rel_to_root.replace(os.sep, "/") if os.sep != "/" else rel_to_root
+        db_path = self._encode_db_path(root, file_path, root_id=root_id, rel_posix=rel_posix)
+        return rel_to_root, db_path, self._derive_repo_label(root, file_path, rel_to_root)
+
+    def _file_meta(self, db_path: str):
+        if hasattr(self.db, "get_file_meta"):
+            return self.db.get_file_meta(db_path)
+        return None
+
+    @staticmethod
+    def _stat_matches(prev, st: os.stat_result) -> bool:
+        return bool(prev) and int(st.st_mtime) == int(prev[0]) and int(st.st_size) == int(prev[1])
+
+    def _extract_cached(self, db_path: str, ext: str, content: str, content_hash: str) -> Tuple[List, List, str, str]:
+        """Symbol extraction memoized on (path, content hash); a forced rescan or a
+        reverted file skips the tree-sitter parse."""
+        key = (db_path, content_hash, _PARSE_CACHE_VERSION)
+        cached = self._ast_cache.get(key)
+        if cached is not None:
+            self._ast_cache.move_to_end(key)
+            symbols, relations, ast_status, ast_reason = cached
+            return list(symbols), list(relations), ast_status, ast_reason
+
+        symbols, relations = [], []
+        ast_status, ast_reason = "skipped", "none"
+        if self.extractor_cb:
+            try:
+                res = self.extractor_cb(db_path, content)
+                if isinstance(res, tuple): symbols, relations = res
+            except: pass
+
+        lang = ParserFactory.get_language(ext)
+        if lang and self.ast_engine.enabled:
+            source = content.encode("utf-8", errors="ignore")  # shared by parse and extraction
+            tree = self.ast_engine.parse(lang, source)
+            if tree:
+                ast_status, ast_reason = "ok", "none"
+                try:
+                    ts_symbols, _ = self.ast_engine.extract_symbols(db_path, lang, content, tree=tree, source=source)
+                    if ts_symbols: symbols = self._merge_symbols(symbols, ts_symbols)
+                except: pass
+            else: ast_status, ast_reason = "failed", "parse_error"
+
+        if self._ast_cache_max > 0:
+            self._ast_cache[key] = (tuple(symbols), tuple(relations), ast_status, ast_reason)
+            if len(self._ast_cache) > self._ast_cache_max:
+                self._ast_cache.popitem(last=False)
+        return symbols, relations, ast_status, ast_reason
+
     def _skip_result(self, db_path, repo, st, scan_ts, reason):
         return {
             "type": "changed", "rel": db_path, "repo": repo, "mtime": int(st.st_mtime), "size": st.st_size,
@@ -158,13 +257,15 @@ class IndexWorker:
         if os.sep in rel_to_root: return rel_to_root.split(os.sep, 1)[0]
         return root.name
 
-    def _encode_db_path(self, root: Path, file_path: Path, root_id: Optional[str] = None) -> str:
+    def _encode_db_path(self, root: Path, file_path: Path, root_id: Optional[str] = None, rel_posix: Optional[str] = None) -> str:
         if not root_id:
             try:
                 from sari.core.workspace import WorkspaceManager
                 root_id = WorkspaceManager.root_id_for_workspace(str(root))
             except Exception:
                 root_id = "default_root"
+        if rel_posix is not None:
+            return f"{root_id}/{rel_posix}"
         try:
             rel = file_path.relative_to(root).as_posix()
         except ValueError:
@@ -175,5 +276,32 @@ class IndexWorker:
         seen = set(); out = []
         for s in base + extra:
             key = (s[1], s[2], s[3], s[4])
-            if key in seen: seen.add(key); out.append(s)
+            if key not in seen: seen.add(key); out.append(s)
         return out
+
+
+class _FileMetaSnapshot:
+    """Read-only stand-in for the DB in parse workers, serving the parent's
+    preloaded file metadata so unchanged files are still skipped."""
+    def __init__(self, file_meta: Dict[str, tuple]):
+        self._file_meta = file_meta
+
+    def get_file_meta(self, path: str) -> Optional[tuple]:
+        return self._file_meta.get(path)
+
+
+# Per-process worker for Indexer's parse pool; the parent keeps the DB.
+_child_worker: Optional[IndexWorker] = None
+
+def _init_child_worker(cfg, file_meta: Optional[Dict[str, tuple]] = None) -> None:
+    global _child_worker
+    db = _FileMetaSnapshot(file_meta) if file_meta else None
+    _child_worker = IndexWorker(cfg, db, None, None)
+
+def _process_file_in_child(args: Tuple) -> Optional[Dict[str, Any]]:
+    root, file_path, st, scan_ts, now, excluded, root_id = args
+    return _child_worker.process_file_task(root, file_path, st, scan_ts, now, excluded, root_id=root_id)
+
+
+def _process_files_in_child(chunk: List[Tuple]) -> List[Optional[Dict[str, Any]]]:
+    return [_process_file_in_child(args) for args in chunk]
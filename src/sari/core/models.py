@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Any
 import time
@@ -12,8 +13,13 @@ class SearchOptions(BaseModel):
     repo: Optional[str] = None
     snippet_lines: int = 3
     total_mode: str = "exact"
+    file_types: List[str] = Field(default_factory=list)
+    path_pattern: Optional[str] = None
+    exclude_patterns: List[str] = Field(default_factory=list)
 
-class SearchHit(BaseModel):
+@dataclass
+class SearchHit:
+    # Built per hit on every search and serialized natively by orjson, so no pydantic validation here.
     repo: str = ""
     path: str = ""
     score: float = 0.0
@@ -1,8 +1,7 @@
-from typing import Any, Optional, List, Tuple, Dict
-import json
+from typing import Any, Optional, List, Tuple, Dict, Union
 import logging
 import re
-from .common import _qualname, _symbol_id
+from .common import _qualname, _symbol_id, _json_dumps
 from .handlers import HandlerRegistry
 
 try:
@@ -18,6 +17,9 @@ class ASTEngine:
     def __init__(self):
         self.logger = logging.getLogger("sari.ast")
         self.registry = HandlerRegistry()
+        # Grammar and Parser per language, loaded once; None marks a miss.
+        self._languages: Dict[str, Any] = {}
+        self._parsers: Dict[str, Any] = {}
     
     @property
     def enabled(self) -> bool: return HAS_LIBS
@@ -26,24 +28,52 @@ class ASTEngine:
         if not HAS_LIBS: return None
         m = {"hcl": "hcl", "tf": "hcl", "py": "python", "js": "javascript", "ts": "typescript", "java": "java", "kt": "kotlin", "rs": "rust", "go": "go", "sh": "bash", "sql": "sql", "swift": "swift"}
         target = m.get(name.lower(), name.lower())
+        if target in self._languages:
+            return self._languages[target]
         try:
-            return get_language(target)
+            lang = get_language(target)
         except Exception as e:
             print(f"⚠️ Warning: Could not load language {target}: {e}")
+            lang = None
+        self._languages[target] = lang
+        return lang
+
+    def _get_parser(self, name: str) -> Any:
+        key = name.lower()
+        parser = self._parsers.get(key)
+        if parser is None and key not in self._parsers:
+            lang_obj = self._get_language(key)
+            if lang_obj is not None:
+                parser = Parser(); parser.set_language(lang_obj)
+            self._parsers[key] = parser
+        return parser
+
+    def parse(self, language: str, content: Union[str, bytes]) -> Any:
+        """Parse source with the C tree-sitter grammar; None if unavailable or failing.
+        Accepts the UTF-8 bytes directly so callers can share one encoding."""
+        if not HAS_LIBS or not content: return None
+        parser = self._get_parser(language)
+        if parser is None: return None
+        try:
+            if isinstance(content, str):
+                content = content.encode("utf-8", errors="ignore")
+            return parser.parse(content)
+        except Exception:
             return None
 
-    def extract_symbols(self, path: str, language: str, content: str, tree: Any = None) -> Tuple[List[Tuple], List[Any]]:
+    def extract_symbols(self, path: str, language: str, content: str, tree: Any = None, source: Optional[bytes] = None) -> Tuple[List[Tuple], List[Any]]:
+        """source is content's UTF-8 encoding when the caller already has it."""
         if not HAS_LIBS or not content: return [], []
         ext = path.split(".")[-1].lower() if "." in path else language.lower()
         
-        lang_obj = self._get_language(ext)
-        if not lang_obj: return [], []
+        parser = self._get_parser(ext)
+        if parser is None: return [], []
         
-        parser = Parser(); parser.set_language(lang_obj)
+        data = source if source is not None else content.encode("utf-8", errors="ignore")
         if tree is None:
-            tree = parser.parse(content.encode("utf-8", errors="ignore"))
+            tree = parser.parse(data)
         
-        data = content.encode("utf-8", errors="ignore"); lines = content.splitlines(); symbols = []
+        lines = content.splitlines(); symbols = []
         def get_t(n): return data[n.start_byte:n.end_byte].decode("utf-8", errors="ignore")
         def find_id(node):
             for c in node.children:
@@ -54,18 +84,23 @@ class ASTEngine:
             return None
 
         handler = self.registry.get_handler(ext)
-        def walk(node, p_name="", p_meta=None):
-            kind, name, meta, is_valid = None, None, {"annotations": []}, False
+        # Preorder walk on an explicit stack: deeply nested sources would
+        # otherwise hit the recursion limit and lose every symbol.
+        stack = [(tree.root_node, "", {})]
+        while stack:
+            node, p_name, p_meta = stack.pop()
+            # Most nodes are not symbols: only build default meta for ones that are.
+            kind, name, meta, is_valid = None, None, None, False
             if handler:
                 kind, name, meta, is_valid = handler.handle_node(node, get_t, find_id, ext, p_meta or {})
                 if is_valid and not name: name = find_id(node)
             elif node.type in ("class_declaration", "function_definition", "method_declaration", "resource"):
-                kind, is_valid, name = "class", True, find_id(node)
+                kind, is_valid, name, meta = "class", True, find_id(node), {"annotations": []}
 
             if is_valid and name:
                 start, end = node.start_point[0] + 1, node.end_point[0] + 1
-                symbols.append((path, name, kind, start, end, lines[start-1].strip() if start <= len(lines) else "", p_name, json.dumps(meta), "", name, _symbol_id(path, kind, name)))
+                symbols.append((path, name, kind, start, end, lines[start-1].strip() if start <= len(lines) else "", p_name, _json_dumps(meta), "", name, _symbol_id(path, kind, name)))
                 p_name, p_meta = name, meta
-            for child in node.children: walk(child, p_name, p_meta)
-
-        walk(tree.root_node, p_meta={}); return symbols, []
+            if node.child_count:
+                stack.extend((child, p_name, p_meta) for child in reversed(node.children))
+        return symbols, []
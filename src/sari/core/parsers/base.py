@@ -1,11 +1,14 @@
-import re
 from typing import List, Tuple
+from .common import _safe_compile
+
+_DQ_STRING_RE = _safe_compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_SQ_STRING_RE = _safe_compile(r"'[^'\\]*(?:\\.[^'\\]*)*'")
 
 class BaseParser:
     def sanitize(self, line: str) -> str:
         # Replace string literals with empty ones to simplify parsing
-        line = re.sub(r'"[^"\\]*(?:\\.[^"\\]*)*"', '""', line)
-        line = re.sub(r"'[^'\\]*(?:\\.[^'\\]*)*'", "''", line)
+        if '"' in line: line = _DQ_STRING_RE.sub('""', line)
+        if "'" in line: line = _SQ_STRING_RE.sub("''", line)
         return line.split('//')[0].strip()
 
     def clean_doc(self, lines: List[str]) -> str:
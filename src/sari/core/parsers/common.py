@@ -1,8 +1,19 @@
-import re
 import hashlib
+import json
 from typing import Dict, Optional, Any
 
-def _safe_compile(pattern: str, flags: int = 0, fallback: Optional[str] = None) -> re.Pattern:
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+try:
+    # Drop-in replacement for re with a faster matcher; optional.
+    import regex as re
+except ImportError:
+    import re
+
+def _safe_compile(pattern: str, flags: int = 0, fallback: Optional[str] = None) -> "re.Pattern":
     try:
         return re.compile(pattern, flags)
     except re.error:
@@ -11,6 +22,15 @@ def _safe_compile(pattern: str, flags: int = 0, fallback: Optional[str] = None)
             except re.error: pass
         return re.compile(r"a^")
 
+def _json_dumps(obj: Any) -> str:
+    """Symbol metadata JSON; orjson when available (compact, not ASCII-escaped)."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
 def _qualname(parent: str, name: str) -> str:
     parent = (parent or "").strip()
     if not parent:
@@ -4,6 +4,59 @@ from .python import PythonParser
 from .generic import GenericRegexParser
 from .common import _safe_compile
 
+# Built-in regex configurations, compiled once at import.
+_BUILTIN_CONFIGS: Dict[str, Dict] = {
+    ".java": {
+        "re_class": _safe_compile(r"\b(class|interface|enum|record|@interface)\s+([a-zA-Z0-9_]+)"),
+        "re_method": _safe_compile(r"(?:(?:public|protected|private|static|final|native|synchronized|abstract|transient|@\w+(?:\([^)]*\))?)\s+)+[\w<>\[\]\s,\?]+\s+(\w+)\s*\("),
+    },
+    ".kt": {
+        "re_class": _safe_compile(r"\b(class|interface|enum|object|data\s+class|sealed\s+class)\s+([a-zA-Z0-9_]+)"), 
+        "re_method": _safe_compile(r"\bfun\s+(?:<[^>]+>\s+)?([a-zA-Z0-9_]+)\b\s*\(")
+    },
+    ".go": {
+        "re_class": _safe_compile(r"\b(type|struct|interface)\s+([a-zA-Z0-9_]+)"), 
+        "re_method": _safe_compile(r"\bfunc\s+(?:\([^)]+\)\s+)?([a-zA-Z0-9_]+)\b\s*\("), 
+        "method_kind": "function"
+    },
+    ".cpp": {
+        "re_class": _safe_compile(r"\b(class|struct|enum|namespace)\s+([a-zA-Z0-9_]+)"), 
+        "re_method": _safe_compile(r"(?:[a-zA-Z0-9_:<>]+\s+)?\b([a-zA-Z0-9_]+)\b\s*\(")
+    },
+    ".js": {
+        "re_class": _safe_compile(r"\b(class)\s+([a-zA-Z0-9_]+)"), 
+        "re_method": _safe_compile(r"(?:async\s+)?function\s+([a-zA-Z0-9_]+)\b\s*\(|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?function\b|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>|\b([a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{")
+    },
+    ".jsx": {
+        "re_class": _safe_compile(r"\b(class)\s+([a-zA-Z0-9_]+)"), 
+        "re_method": _safe_compile(r"(?:async\s+)?function\s+([a-zA-Z0-9_]+)\b\s*\(|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?function\b|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>|\b([a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{")
+    },
+    ".ts": {
+        "re_class": _safe_compile(r"\b(class|interface|enum)\s+([a-zA-Z0-9_]+)"), 
+        "re_method": _safe_compile(r"(?:async\s+)?function\s+([a-zA-Z0-9_]+)\b\s*\(|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?function\b|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>|\b([a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{")
+    },
+    ".tsx": {
+        "re_class": _safe_compile(r"\b(class|interface|enum)\s+([a-zA-Z0-9_]+)"), 
+        "re_method": _safe_compile(r"(?:async\s+)?function\s+([a-zA-Z0-9_]+)\b\s*\(|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?function\b|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>|\b([a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{")
+    },
+    ".vue": {
+        "re_class": _safe_compile(r"\b(class)\s+([a-zA-Z0-9_]+)"), 
+        "re_method": _safe_compile(r"(?:async\s+)?function\s+([a-zA-Z0-9_]+)\b\s*\(|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?function\b|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>|\b([a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{")
+    },
+    ".rs": {
+        "re_class": _safe_compile(r"\b(struct|enum|trait|union|mod)\s+([a-zA-Z0-9_]+)"), 
+        "re_method": _safe_compile(r"\bfn\s+([a-zA-Z0-9_]+)\b\s*[<(]")
+    },
+    ".ex": {
+        "re_class": _safe_compile(r"\bdefmodule\s+([a-zA-Z0-9_.]+)"), 
+        "re_method": _safe_compile(r"\bdef(?:p)?\s+([a-zA-Z0-9_!?]+)\b\s*[({]|\bdef(?:p)?\s+([a-zA-Z0-9_!?]+)\s*,\s*do")
+    },
+    ".exs": {
+        "re_class": _safe_compile(r"\bdefmodule\s+([a-zA-Z0-9_.]+)"), 
+        "re_method": _safe_compile(r"\bdef(?:p)?\s+([a-zA-Z0-9_!?]+)\b\s*[({]|\bdef(?:p)?\s+([a-zA-Z0-9_!?]+)\s*,\s*do")
+    }
+}
+
 class ParserFactory:
     """
     Priority 12: Formal Parser Registry for Plugin Extensibility.
@@ -50,61 +103,10 @@ class ParserFactory:
             cls.register_parser(ext, parser)
             return parser
             
-        # 3. Built-in Regex Configurations (Restored)
-        configs = {
-            ".java": {
-                "re_class": _safe_compile(r"\b(class|interface|enum|record|@interface)\s+([a-zA-Z0-9_]+)"),
-                "re_method": _safe_compile(r"(?:(?:public|protected|private|static|final|native|synchronized|abstract|transient|@\w+(?:\([^)]*\))?)\s+)+[\w<>\[\]\s,\?]+\s+(\w+)\s*\("),
-            },
-            ".kt": {
-                "re_class": _safe_compile(r"\b(class|interface|enum|object|data\s+class|sealed\s+class)\s+([a-zA-Z0-9_]+)"), 
-                "re_method": _safe_compile(r"\bfun\s+(?:<[^>]+>\s+)?([a-zA-Z0-9_]+)\b\s*\(")
-            },
-            ".go": {
-                "re_class": _safe_compile(r"\b(type|struct|interface)\s+([a-zA-Z0-9_]+)"), 
-                "re_method": _safe_compile(r"\bfunc\s+(?:\([^)]+\)\s+)?([a-zA-Z0-9_]+)\b\s*\("), 
-                "method_kind": "function"
-            },
-            ".cpp": {
-                "re_class": _safe_compile(r"\b(class|struct|enum|namespace)\s+([a-zA-Z0-9_]+)"), 
-                "re_method": _safe_compile(r"(?:[a-zA-Z0-9_:<>]+\s+)?\b([a-zA-Z0-9_]+)\b\s*\(")
-            },
-            ".js": {
-                "re_class": _safe_compile(r"\b(class)\s+([a-zA-Z0-9_]+)"), 
-                "re_method": _safe_compile(r"(?:async\s+)?function\s+([a-zA-Z0-9_]+)\b\s*\(|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?function\b|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>|\b([a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{")
-            },
-            ".jsx": {
-                "re_class": _safe_compile(r"\b(class)\s+([a-zA-Z0-9_]+)"), 
-                "re_method": _safe_compile(r"(?:async\s+)?function\s+([a-zA-Z0-9_]+)\b\s*\(|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?function\b|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>|\b([a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{")
-            },
-            ".ts": {
-                "re_class": _safe_compile(r"\b(class|interface|enum)\s+([a-zA-Z0-9_]+)"), 
-                "re_method": _safe_compile(r"(?:async\s+)?function\s+([a-zA-Z0-9_]+)\b\s*\(|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?function\b|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>|\b([a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{")
-            },
-            ".tsx": {
-                "re_class": _safe_compile(r"\b(class|interface|enum)\s+([a-zA-Z0-9_]+)"), 
-                "re_method": _safe_compile(r"(?:async\s+)?function\s+([a-zA-Z0-9_]+)\b\s*\(|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?function\b|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>|\b([a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{")
-            },
-            ".vue": {
-                "re_class": _safe_compile(r"\b(class)\s+([a-zA-Z0-9_]+)"), 
-                "re_method": _safe_compile(r"(?:async\s+)?function\s+([a-zA-Z0-9_]+)\b\s*\(|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?function\b|\b([a-zA-Z0-9_]+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>|\b([a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{")
-            },
-            ".rs": {
-                "re_class": _safe_compile(r"\b(struct|enum|trait|union|mod)\s+([a-zA-Z0-9_]+)"), 
-                "re_method": _safe_compile(r"\bfn\s+([a-zA-Z0-9_]+)\b\s*[<(]")
-            },
-            ".ex": {
-                "re_class": _safe_compile(r"\bdefmodule\s+([a-zA-Z0-9_.]+)"), 
-                "re_method": _safe_compile(r"\bdef(?:p)?\s+([a-zA-Z0-9_!?]+)\b\s*[({]|\bdef(?:p)?\s+([a-zA-Z0-9_!?]+)\s*,\s*do")
-            },
-            ".exs": {
-                "re_class": _safe_compile(r"\bdefmodule\s+([a-zA-Z0-9_.]+)"), 
-                "re_method": _safe_compile(r"\bdef(?:p)?\s+([a-zA-Z0-9_!?]+)\b\s*[({]|\bdef(?:p)?\s+([a-zA-Z0-9_!?]+)\s*,\s*do")
-            }
-        }
-        
-        if ext in configs:
-            parser = GenericRegexParser(configs[ext], ext)
+        # 3. Built-in Regex Configurations
+        config = _BUILTIN_CONFIGS.get(ext)
+        if config is not None:
+            parser = GenericRegexParser(config, ext)
             cls.register_parser(ext, parser)
             return parser
             
@@ -1,73 +1,109 @@
-import re
-import json
+import sys
 from typing import List, Tuple, Dict, Any, Optional
 from pathlib import Path
 from .base import BaseParser
-from .common import _qualname, _symbol_id, _safe_compile, NORMALIZE_KIND_BY_EXT
+from .common import _qualname, _symbol_id, _safe_compile, _json_dumps, re, NORMALIZE_KIND_BY_EXT
+
+_BLOCK_COMMENT_RE = _safe_compile(r"/\*.*?\*/", re.DOTALL)
+_DQ_STRING_RE = _safe_compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_SQ_STRING_RE = _safe_compile(r"'[^'\\]*(?:\\.[^'\\]*)*'")
+_QUOTED_RE = _safe_compile(r'"([^"]+)"')
+_MODIFIERS = r"public|private|protected|static|final|abstract|synchronized|native|default"
+# One pass instead of OR-ing separate searches: definition keywords or
+# modifiers, `Type name(`, direct `name(...) {`, or an arrow function.
+_LOOKS_LIKE_DEF_RE = _safe_compile(
+    r"\b(?:class|interface|enum|record|def|fun|function|func|" + _MODIFIERS + r")\b"
+    r"|\b[a-zA-Z_][a-zA-Z0-9_<>,.\[\]]+\s+[A-Za-z_][A-Za-z0-9_]*\s*\("
+    r"|\b[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*\{"
+    r"|=>"
+)
+# Modifier or generic-args line without a call: a method header split across lines.
+_METHOD_PREFIX_RE = _safe_compile(r"\b(?:" + _MODIFIERS + r")\b|<[^>]+>")
+# Also covers `.name(` member calls: the name always starts on a word boundary.
+_CALL_RE = _safe_compile(r"\b([A-Za-z_][A-Za-z0-9_]*)\s*\(")
+_CALL_KEYWORDS = frozenset((
+    "if", "for", "while", "switch", "catch", "return", "new", "class", "interface",
+    "enum", "case", "do", "else", "try", "throw", "throws", "super", "this", "synchronized",
+))
+_JS_LIKE_EXTS = frozenset((".js", ".jsx", ".ts", ".tsx", ".vue"))
+_JS_NOISE_NAMES = frozenset((
+    "if", "for", "while", "switch", "catch", "return", "new", "class", "interface",
+    "enum", "case", "do", "else", "try", "throw", "throws", "super", "this",
+    "function", "const", "let", "var", "default",
+))
 
 class GenericRegexParser(BaseParser):
+    # Inheritance/annotation patterns are language-independent; compile once.
+    re_extends = _safe_compile(r"(?:\bextends\b|:)\s+([a-zA-Z0-9_<>,.\[\]\(\)\?\&\s]+?)(?=\s+\bimplements\b|\s*[{]|$)", fallback=r"\bextends\s+([a-zA-Z0-9_<>,.\[\]\s]+)")
+    re_implements = _safe_compile(r"\bimplements\s+([a-zA-Z0-9_<>,.\[\]\(\)\?\&\s]+)(?=\s*[{]|$)", fallback=r"\bimplements\s+([a-zA-Z0-9_<>,.\[\]\s]+)")
+    re_ext_start = _safe_compile(r"^\s*(?:extends|:)\s+([a-zA-Z0-9_<>,.\[\]\(\)\?\&\s]+?)(?=\s+\bimplements\b|\s*[{]|$)", fallback=r"^\s*extends\s+([a-zA-Z0-9_<>,.\[\]\s]+)")
+    re_impl_start = _safe_compile(r"^\s*implements\s+([a-zA-Z0-9_<>,.\[\]\(\)\?\&\s]+)(?=\s*{|$)", fallback=r"^\s*implements\s+([a-zA-Z0-9_<>,.\[\]\s]+)")
+    re_ext_partial = _safe_compile(r"\b(?:extends|:)\s+(.+)$")
+    re_impl_partial = _safe_compile(r"\bimplements\s+(.+)$")
+    re_inherit_cont = _safe_compile(r"^\s*([a-zA-Z0-9_<>,.\[\]\(\)\?\&\s]+)(?=\s*{|$)")
+    # Support @annotations, @doc, @impl, etc.
+    re_anno = _safe_compile(r"^\s*@([a-zA-Z0-9_]+)(?:\s*\((?:(?!@).)*?\))?|@([a-zA-Z0-9_]+)")
+
     def __init__(self, config: Dict[str, Any], ext: str):
         self.ext = ext.lower()
         self.re_class = config["re_class"]
         self.re_method = config["re_method"]
         self.method_kind = config.get("method_kind", "method")
-
-        self.re_extends = _safe_compile(r"(?:\bextends\b|:)\s+([a-zA-Z0-9_<>,.\[\]\(\)\?\&\s]+?)(?=\s+\bimplements\b|\s*[{]|$)", fallback=r"\bextends\s+([a-zA-Z0-9_<>,.\[\]\s]+)")
-        self.re_implements = _safe_compile(r"\bimplements\s+([a-zA-Z0-9_<>,.\[\]\(\)\?\&\s]+)(?=\s*[{]|$)", fallback=r"\bimplements\s+([a-zA-Z0-9_<>,.\[\]\s]+)")
-        self.re_ext_start = _safe_compile(r"^\s*(?:extends|:)\s+([a-zA-Z0-9_<>,.\[\]\(\)\?\&\s]+?)(?=\s+\bimplements\b|\s*[{]|$)", fallback=r"^\s*extends\s+([a-zA-Z0-9_<>,.\[\]\s]+)")
-        self.re_impl_start = _safe_compile(r"^\s*implements\s+([a-zA-Z0-9_<>,.\[\]\(\)\?\&\s]+)(?=\s*{|$)", fallback=r"^\s*implements\s+([a-zA-Z0-9_<>,.\[\]\s]+)")
-        self.re_ext_partial = _safe_compile(r"\b(?:extends|:)\s+(.+)$")
-        self.re_impl_partial = _safe_compile(r"\bimplements\s+(.+)$")
-        self.re_inherit_cont = _safe_compile(r"^\s*([a-zA-Z0-9_<>,.\[\]\(\)\?\&\s]+)(?=\s*{|$)")
-        # Support @annotations, @doc, @impl, etc.
-        self.re_anno = _safe_compile(r"^\s*@([a-zA-Z0-9_]+)(?:\s*\((?:(?!@).)*?\))?|@([a-zA-Z0-9_]+)")
         self.kind_norm = NORMALIZE_KIND_BY_EXT.get(self.ext, {})
 
     @staticmethod
     def _split_inheritance_list(s: str) -> List[str]:
-        s = re.split(r'[{;]', s)[0]
-        parts = [p.strip() for p in s.split(",")]
+        for stop in "{;":
+            cut = s.find(stop)
+            if cut >= 0: s = s[:cut]
         out = []
-        for p in parts:
-            p = re.sub(r"\s+", " ", p).strip()
-            original = p
-            stripped = re.sub(r"\s*\([^)]*\)\s*$", "", p)
-            if stripped and stripped != original:
+        for p in s.split(","):
+            # Collapse whitespace runs; then drop one trailing "(...)" (and the
+            # space before it), e.g. "Base(arg)" -> also emit "Base".
+            p = " ".join(p.split())
+            if not p:
+                continue
+            stripped = p
+            if p[-1] == ")":
+                close = len(p) - 1
+                opened = p.find("(", p.rfind(")", 0, close) + 1, close)
+                if opened >= 0:
+                    stripped = p[:opened - 1] if opened and p[opened - 1] == " " else p[:opened]
+            if stripped and stripped != p:
                 out.append(stripped)
-                out.append(original)
-            elif original:
-                out.append(original)
+            out.append(p)
         return out
 
     def sanitize(self, line: str) -> str:
         """Strip single-line comments and strings to prevent false matches."""
-        # Strip single line comments
-        line = re.sub(r"//.*$", "", line)
-        line = re.sub(r"#.*$", "", line)
+        # Strip single line comments (lines come from splitlines(), so a
+        # "//.*$" / "#.*$" match is just a cut at the first marker)
+        cut = line.find("//")
+        if cut >= 0: line = line[:cut]
+        cut = line.find("#")
+        if cut >= 0: line = line[:cut]
         # Replace string contents but keep quotes to preserve structure
-        line = re.sub(r'"[^"\\]*(?:\\.[^"\\]*)*"', '""', line)
-        line = re.sub(r"'[^'\\]*(?:\\.[^'\\]*)*'", "''", line)
+        if '"' in line: line = _DQ_STRING_RE.sub('""', line)
+        if "'" in line: line = _SQ_STRING_RE.sub("''", line)
         return line
 
     def extract(self, path: str, content: str) -> Tuple[List[Tuple], List[Tuple]]:
         symbols, relations = [], []
-        js_like_ext = {".js", ".jsx", ".ts", ".tsx", ".vue"}
-        js_noise_names = {
-            "if", "for", "while", "switch", "catch", "return", "new", "class", "interface",
-            "enum", "case", "do", "else", "try", "throw", "throws", "super", "this",
-            "function", "const", "let", "var", "default",
-        }
         
         # Pre-process: Blank out block comments while preserving line count
         # This prevents matching symbols inside multi-line comments.
         processed_content = content
-        for m in re.finditer(r"/\*.*?\*/", content, re.DOTALL):
+        for m in _BLOCK_COMMENT_RE.finditer(content):
             replacement = "\n" * m.group(0).count("\n")
             # We use spaces to maintain columns if needed, but \n is enough for line-based regex
             processed_content = processed_content[:m.start()] + replacement + processed_content[m.end():]
         
         lines = processed_content.splitlines()
-        active_scopes: List[Tuple[int, Dict[str, Any]]] = []
+        # Open scopes as two parallel lists: brace balance at push time, and a
+        # symbol row (path, name, kind, line, raw, parent, meta, doc, qual, sid)
+        # that only needs its end line spliced in when the scope closes.
+        scope_bal: List[int] = []
+        scope_rows: List[Tuple] = []
         cur_bal, in_doc = 0, False
         pending_doc, pending_annos, last_path = [], [], None
         pending_type_decl, pending_inheritance_mode = None, None
@@ -86,11 +122,6 @@ class GenericRegexParser(BaseParser):
             pending_inheritance_mode = None
             pending_inheritance_extends, pending_inheritance_impls = [], []
 
-        call_keywords = {
-            "if", "for", "while", "switch", "catch", "return", "new", "class", "interface",
-            "enum", "case", "do", "else", "try", "throw", "throws", "super", "this", "synchronized",
-        }
-
         for i, line in enumerate(lines):
             line_no = i + 1
             raw = line.strip()
@@ -124,7 +155,7 @@ class GenericRegexParser(BaseParser):
                     if tag_upper not in pending_annos:
                         pending_annos.append(tag_upper)
                     # Extract path from complex annotation string
-                    path_match = re.search(r'"([^"]+)"', m_anno.group(0))
+                    path_match = _QUOTED_RE.search(m_anno.group(0))
                     if path_match: last_path = path_match.group(1)
                 if clean.startswith("@"): continue
 
@@ -153,8 +184,9 @@ class GenericRegexParser(BaseParser):
                 name, kind_raw = m.group(2), m.group(1).lower().strip()
                 kind = self.kind_norm.get(kind_raw, kind_raw)
                 if kind == "record": kind = "class"
+                kind = sys.intern(kind)  # regex groups are fresh strings per match
                 matches.append((name, kind, m.start()))
-                parent_qual = active_scopes[-1][1].get("qual", "") if active_scopes else ""
+                parent_qual = scope_rows[-1][8] if scope_rows else ""
                 qual = _qualname(parent_qual, name)
                 sid = _symbol_id(path, kind, qual)
                 pending_type_decl = (name, line_no, sid)
@@ -176,15 +208,7 @@ class GenericRegexParser(BaseParser):
                 if "{" in clean:
                     flush_inheritance(line_no, clean)
 
-            looks_like_def = (
-                bool(re.search(r"\b(class|interface|enum|record|def|fun|function|func)\b", method_line)) or
-                bool(re.search(r"\b(public|private|protected|static|final|abstract|synchronized|native|default)\b", method_line)) or
-                bool(re.search(r"\b[a-zA-Z_][a-zA-Z0-9_<>,.\[\]]+\s+[A-Za-z_][A-Za-z0-9_]*\s*\(", method_line)) or
-                # Support direct method definitions: name() { ... }
-                bool(re.search(r"\b[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*\{", method_line)) or
-                # Support arrow functions with block or expression body.
-                bool(re.search(r"=>", method_line))
-            )
+            looks_like_def = _LOOKS_LIKE_DEF_RE.search(method_line) is not None
             if looks_like_def:
                 for m in self.re_method.finditer(method_line):
                     # Get the first non-None group from the match
@@ -194,8 +218,8 @@ class GenericRegexParser(BaseParser):
 
             filtered_matches: List[Tuple[str, str, int]] = []
             for name, kind, pos in sorted(matches, key=lambda x: x[2]):
-                if self.ext in js_like_ext:
-                    if name in js_noise_names:
+                if self.ext in _JS_LIKE_EXTS:
+                    if name in _JS_NOISE_NAMES:
                         continue
                     # Regex fallback frequently captures single-letter temp variables in JS/Vue.
                     if len(name) < 2:
@@ -205,45 +229,26 @@ class GenericRegexParser(BaseParser):
             for name, kind, _ in filtered_matches:
                 meta = {"annotations": pending_annos.copy()}
                 if last_path: meta["http_path"] = last_path
-                parent = active_scopes[-1][1]["name"] if active_scopes else ""
-                parent_qual = active_scopes[-1][1].get("qual", "") if active_scopes else ""
+                parent, parent_qual = (scope_rows[-1][1], scope_rows[-1][8]) if scope_rows else ("", "")
                 qual = _qualname(parent_qual, name)
                 sid = _symbol_id(path, kind, qual)
-                info = {
-                    "path": path,
-                    "name": name,
-                    "kind": kind,
-                    "line": line_no,
-                    "meta": json.dumps(meta),
-                    "doc": self.clean_doc(pending_doc),
-                    "raw": line.strip(),
-                    "parent": parent,
-                    "qual": qual,
-                    "sid": sid,
-                }
-                active_scopes.append((cur_bal, info))
+                scope_bal.append(cur_bal)
+                scope_rows.append((path, name, kind, line_no, line.strip(), parent, _json_dumps(meta), self.clean_doc(pending_doc), qual, sid))
                 pending_annos, last_path, pending_doc = [], None, []
 
-            if not filtered_matches and clean and not clean.startswith("@") and not in_doc:
+            if not filtered_matches and "(" in clean and not clean.startswith("@") and not in_doc:
                 current_symbol = None
                 current_sid = None
-                for _, info in reversed(active_scopes):
-                    if info.get("kind") in (self.method_kind, "method", "function"):
-                        current_symbol = info.get("name")
-                        current_sid = info.get("sid")
+                for row in reversed(scope_rows):
+                    if row[2] in (self.method_kind, "method", "function"):
+                        current_symbol = row[1]
+                        current_sid = row[9]
                         break
                 if current_symbol and not looks_like_def:
                     call_names = set()
-                    for m in re.finditer(r"\b([A-Za-z_][A-Za-z0-9_]*)\s*\(", clean):
-                        name = m.group(1)
-                        if name in call_keywords:
-                            continue
-                        call_names.add(name)
-                    for m in re.finditer(r"\.\s*([A-Za-z_][A-Za-z0-9_]*)\s*\(", clean):
-                        name = m.group(1)
-                        if name in call_keywords:
-                            continue
-                        call_names.add(name)
+                    for name in _CALL_RE.findall(clean):
+                        if name not in _CALL_KEYWORDS:
+                            call_names.add(name)
                     for name in call_names:
                         relations.append((path, current_symbol, current_sid or "", "", name, "", "calls", line_no))
 
@@ -251,48 +256,26 @@ class GenericRegexParser(BaseParser):
                 if "{" not in clean and "}" not in clean: pending_doc = []
 
             if not filtered_matches and "(" not in clean and not clean.startswith("@"):
-                if re.search(r"\b(public|private|protected|static|final|abstract|synchronized|native|default)\b", clean) or re.search(r"<[^>]+>", clean):
+                if _METHOD_PREFIX_RE.search(clean):
                     if not self.re_class.search(clean):
                         pending_method_prefix = clean
 
             op, cl = clean.count("{"), clean.count("}")
             cur_bal += (op - cl)
 
-            if op > 0 or cl > 0:
-                still_active = []
-                for bal, info in active_scopes:
-                    if cur_bal <= bal:
-                        symbols.append((
-                            info["path"],
-                            info["name"],
-                            info["kind"],
-                            info["line"],
-                            line_no,
-                            info["raw"],
-                            info["parent"],
-                            info["meta"],
-                            info["doc"],
-                            info.get("qual", ""),
-                            info.get("sid", ""),
-                        ))
-                    else: still_active.append((bal, info))
-                active_scopes = still_active
+            # Scopes are pushed with non-decreasing balance, so the ones that
+            # close form a suffix; nothing can close on a line without "}".
+            if cl and scope_bal and scope_bal[-1] >= cur_bal:
+                cut = len(scope_bal) - 1
+                while cut > 0 and scope_bal[cut - 1] >= cur_bal:
+                    cut -= 1
+                for row in scope_rows[cut:]:
+                    symbols.append(row[:4] + (line_no,) + row[4:])
+                del scope_bal[cut:], scope_rows[cut:]
 
         last_line = len(lines)
-        for _, info in active_scopes:
-            symbols.append((
-                info["path"],
-                info["name"],
-                info["kind"],
-                info["line"],
-                last_line,
-                info["raw"],
-                info["parent"],
-                info["meta"],
-                info["doc"],
-                info.get("qual", ""),
-                info.get("sid", ""),
-            ))
+        for row in scope_rows:
+            symbols.append(row[:4] + (last_line,) + row[4:])
         if pending_type_decl:
             name, decl_line, from_sid = pending_type_decl
             for b in pending_inheritance_extends:
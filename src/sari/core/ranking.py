@@ -42,14 +42,13 @@ def calculate_recency_score(mtime: int, base_score: float) -> float:
     # Ensure boost works even if base_score is 0 (bias added)
     return (base_score + 0.1) * boost
 
+_TERM_RE = re.compile(r'"([^"]*)"|\'([^\']*)\'|(\S+)')
+
 def extract_terms(q: str) -> List[str]:
-    # Use regex to extract quoted phrases or space-separated words
-    raw = re.findall(r'"([^"]*)"|\'([^\']*)\'|(\S+)', q or "")
+    # Single pass over quoted phrases or space-separated words
     out: List[str] = []
-    for group in raw:
-        # group is a tuple of (double_quoted, single_quoted, bare_word)
-        t = group[0] or group[1] or group[2]
-        t = t.strip()
+    for m in _TERM_RE.finditer(q or ""):
+        t = (m.group(1) or m.group(2) or m.group(3) or "").strip()
         if not t or t in {"AND", "OR", "NOT"}:
             continue
         if ":" in t and len(t.split(":", 1)[0]) <= 10:
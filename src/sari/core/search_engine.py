@@ -1,7 +1,8 @@
+import fnmatch
 import sqlite3
 import re
 import time
-from typing import List, Tuple, Optional, Any, Dict
+from typing import Callable, List, Tuple, Optional, Any, Dict
 from .models import SearchHit, SearchOptions
 from .ranking import snippet_around, get_file_extension
 from .scoring import ScoringPolicy
@@ -9,6 +10,47 @@ from .engine.tantivy_engine import TantivyEngine
 
 from .db.storage import GlobalStorageManager
 
+_FTS_TOKEN_RE = re.compile(
+    r'[()]|"([^"]+)"|\b(AND|OR|NOT|NEAR/\d+|NEAR)\b|([0-9A-Za-z_\u00A1-\uFFFF]+)',
+    re.IGNORECASE,
+)
+
+
+def _compile_excludes(patterns: Optional[List[str]]) -> Optional["re.Pattern[str]"]:
+    """Merge exclude globs (substring semantics, ``*p*``) into one regex, translated once per search."""
+    pats = [p for p in (patterns or []) if p]
+    if not pats:
+        return None
+    return re.compile("|".join(fnmatch.translate(f"*{p}*") for p in pats))
+
+
+def _compile_path_pattern(pattern: Optional[str]) -> Optional["re.Pattern[str]"]:
+    """Match the glob against the whole path, any suffix of it, or any directory inside it."""
+    if not pattern:
+        return None
+    variants = (pattern, f"*/{pattern}", f"*/{pattern}/*")
+    return re.compile("|".join(fnmatch.translate(v) for v in variants))
+
+
+def _path_filter(opts: SearchOptions) -> Optional[Callable[[str], bool]]:
+    include_re = _compile_path_pattern(opts.path_pattern)
+    exclude_re = _compile_excludes(opts.exclude_patterns)
+    # Canonicalized once: "PY", ".py" and "py" all select *.py.
+    exts = frozenset(str(ft).lower().lstrip(".") for ft in (opts.file_types or ()) if str(ft).strip("."))
+    if include_re is None and exclude_re is None and not exts:
+        return None
+
+    def _keep(path: str) -> bool:
+        if exts and get_file_extension(path) not in exts:
+            return False
+        if include_re is not None and not include_re.match(path):
+            return False
+        if exclude_re is not None and exclude_re.match(path):
+            return False
+        return True
+
+    return _keep
+
 class SearchEngine:
     def __init__(self, db, scoring_policy: ScoringPolicy = None, tantivy_engine: Optional[TantivyEngine] = None):
         self.db = db
@@ -39,14 +81,21 @@ class SearchEngine:
             
             seen_paths = {h.path for h in recent_hits}
             all_hits = recent_hits
+            # Tied L2 hits need the mtime tie-break; otherwise groups arrive in score order.
+            needs_sort = len(recent_hits) > 1
 
             # 2. Tantivy (Primary DB Search)
             if self.tantivy_engine and not opts.use_regex:
-                hits = self.tantivy_engine.search(q, root_id=root_id, limit=opts.limit)
+                hits = self.tantivy_engine.search(
+                    q, root_id=root_id, limit=opts.limit, repo=opts.repo, file_types=opts.file_types
+                )
                 if hits:
                     t_hits = self._process_tantivy_hits(hits, opts)
                     # Tantivy 점수 정규화: 최고점을 10.0으로 맞춤 (DB 검색 중 최상위)
                     max_t = max((h.score for h in t_hits), default=1.0)
+                    # Tantivy returns hits score-descending; only ties need re-ordering.
+                    if len({h.score for h in t_hits}) != len(t_hits):
+                        needs_sort = True
                     for h in t_hits:
                         h.score = (h.score / max_t) * 10.0
                         if h.path not in seen_paths:
@@ -71,6 +120,7 @@ class SearchEngine:
                         if h.path not in seen_paths:
                             all_hits.append(h)
                             seen_paths.add(h.path)
+                            needs_sort = True
                 else:
                     like_q = f"%{q}%"
                     sql = (
@@ -88,9 +138,15 @@ class SearchEngine:
                         if h.path not in seen_paths:
                             all_hits.append(h)
                             seen_paths.add(h.path)
+                            needs_sort = True
 
-            # 최종 정렬: 점수 내림차순 -> 시간 내림차순
-            all_hits.sort(key=lambda x: (-x.score, -x.mtime))
+            keep = _path_filter(opts)
+            if keep is not None:
+                all_hits = [h for h in all_hits if keep(h.path)]
+
+            # 최종 정렬: 점수 내림차순 -> 시간 내림차순 (이미 정렬된 경우 생략)
+            if needs_sort:
+                all_hits.sort(key=lambda x: (-x.score, -x.mtime))
             return all_hits[:opts.limit], meta
         finally:
             if hasattr(self.db, "coordinator") and self.db.coordinator:
@@ -170,21 +226,18 @@ class SearchEngine:
             return raw
         # Normalize common OR separators
         raw = raw.replace("||", " OR ").replace("|", " OR ")
-        tokens = re.findall(r'\(|\)|"[^"]+"|\bAND\b|\bOR\b|\bNOT\b|\bNEAR/\d+\b|\bNEAR\b|[0-9A-Za-z_\u00A1-\uFFFF]+', raw, flags=re.IGNORECASE)
-        if not tokens:
-            return raw.replace('"', " ")
         out = []
-        for t in tokens:
-            upper = t.upper()
-            if upper in {"AND", "OR", "NOT"} or upper.startswith("NEAR"):
-                out.append(upper)
-                continue
-            if t in {"(", ")"}:
-                out.append(t)
-                continue
-            if t.startswith('"') and t.endswith('"'):
-                t = t[1:-1]
-            out.append(f'"{t}"')
+        for m in _FTS_TOKEN_RE.finditer(raw):
+            if m.group(1) is not None:
+                out.append(f'"{m.group(1)}"')
+            elif m.group(2) is not None:
+                out.append(m.group(2).upper())
+            elif m.group(3) is not None:
+                out.append(f'"{m.group(3)}"')
+            else:
+                out.append(m.group(0))
+        if not out:
+            return raw.replace('"', " ")
         return " ".join(out)
 
     def _snippet_for(self, path: str, query: str, content: str) -> str:
@@ -220,12 +273,37 @@ class SearchEngine:
         if not q:
             return []
         root_id = list(root_ids)[0] if root_ids else None
+        cur = self.db._get_conn().cursor()
+        if getattr(self.db, "settings", None) and self.db.settings.ENABLE_FTS:
+            rows = self._repo_candidates_fts(cur, q, limit, root_id)
+            if rows is not None:
+                return [{"repo": r[0], "score": int(r[1]), "evidence": ""} for r in rows]
         sql = "SELECT repo, COUNT(1) as c FROM files"
         sql, params = self.db.apply_root_filter(sql, root_id)
         sql += " AND (path LIKE ? OR rel_path LIKE ?)"
         params.extend([f"%{q}%", f"%{q}%"])
         sql += " GROUP BY repo ORDER BY c DESC LIMIT ?"
         params.append(limit)
-        cur = self.db._get_conn().cursor()
         cur.execute(sql, params)
         return [{"repo": r[0], "score": int(r[1]), "evidence": ""} for r in cur.fetchall()]
+
+    def _repo_candidates_fts(self, cur, q: str, limit: int, root_id: Optional[str]) -> Optional[list]:
+        """Count matching files per repo through the rel_path FTS column instead of a LIKE table scan."""
+        tokens = re.findall(r"[0-9A-Za-z\u00A1-\uFFFF]+", q)
+        if not tokens:
+            return None
+        # Prefix phrases keep the old substring feel for partial names ("auth" -> "authentication").
+        match = "rel_path : (" + " AND ".join(f'"{t}"*' for t in tokens) + ")"
+        sql = ("SELECT f.repo, COUNT(1) AS c FROM files_fts JOIN files f ON files_fts.rowid = f.rowid "
+               "WHERE files_fts MATCH ? AND f.deleted_ts = 0")
+        params: List[Any] = [match]
+        if root_id:
+            sql += " AND f.root_id = ?"
+            params.append(root_id)
+        sql += " GROUP BY f.repo ORDER BY c DESC LIMIT ?"
+        params.append(limit)
+        try:
+            cur.execute(sql, params)
+        except sqlite3.OperationalError:
+            return None
+        return cur.fetchall()
@@ -25,7 +25,8 @@ class Settings(BaseSettings):
     WORKSPACE_CONFIG_DIR_NAME: str = ".sari"
     ENGINE_INDEX_POLICY: str = "global"
     ENGINE_RELOAD_MS: int = 1000
-    ENGINE_INDEX_MEM_MB: int = 128
+    ENGINE_INDEX_MEM_MB: int = 256
+    ENGINE_THREADS: int = 2
     FOLLOW_SYMLINKS: bool = False
     ENGINE_MODE: Optional[str] = "embedded"
     ENGINE_AUTO_INSTALL: bool = True
@@ -39,6 +40,7 @@ class Settings(BaseSettings):
     AST_CACHE_ENTRIES: int = 1000
     MAX_PARSE_BYTES: int = 1024 * 1024 # 1MB (Added)
     MAX_AST_BYTES: int = 512 * 1024 # 512KB (Added)
+    INDEX_PROCESSES: int = 0 # parse processes for large full scans; 0 = cpu count, 1 = in-process
     FTS_MAX_BYTES: int = 1000000
     ENGINE_MAX_DOC_BYTES: int = 50000
     
@@ -46,6 +48,8 @@ class Settings(BaseSettings):
     DAEMON_HOST: str = "127.0.0.1"
     DAEMON_PORT: int = 47800
     HTTP_API_PORT: int = 47777
+    HTTP_MAX_CONCURRENCY: int = 16 # GET handlers running at once; extra requests wait
+    HTTP_LISTENERS: int = 1 # >1 binds that many SO_REUSEPORT sockets sharing one worker pool
     DAEMON_IDLE_SEC: int = 3600
     DAEMON_TIMEOUT_SEC: int = 5
     DAEMON_AUTOSTART: bool = True # Default to True for autostart policy
@@ -67,6 +71,7 @@ class Settings(BaseSettings):
     MMAP_SIZE: int = 30 * 1024 * 1024 * 1024 
     PAGE_SIZE: int = 65536 
     MAX_DEPTH: int = 20
+    SCAN_THREADS: int = 1 # >1 walks top-level directories concurrently (helps network filesystems)
     
     @property
     def db_path(self) -> str:
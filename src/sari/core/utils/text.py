@@ -3,7 +3,10 @@ import unicodedata
 def _normalize_engine_text(text: str) -> str:
     if not text:
         return ""
-    norm = unicodedata.normalize("NFKC", text)
+    # ASCII is already NFKC; most source files never need unicodedata at all.
+    if text.isascii():
+        return " ".join(text.lower().split())
+    norm = text if unicodedata.is_normalized("NFKC", text) else unicodedata.normalize("NFKC", text)
     norm = norm.lower()
     norm = " ".join(norm.split())
     return norm
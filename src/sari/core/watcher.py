@@ -1,10 +1,12 @@
 
+import heapq
 import os
+import sys
 import time
 import threading
 from collections import deque
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 try:
     from watchdog.observers import Observer
@@ -52,8 +54,13 @@ class DebouncedEventHandler(FileSystemEventHandler):
         self.logger = logger
         self.git_callback = git_callback
         self.git_debounce_seconds = git_debounce_seconds
-        self._timers = {}
+        # Debounce deadlines are served by one scheduler thread off a heap of
+        # (deadline, path) instead of a Timer thread per pending path.
+        self._deadlines: Dict[str, float] = {}
+        self._due: List[Tuple[float, str]] = []
         self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._scheduler: Optional[threading.Thread] = None
         self._pending_events: Dict[str, FsEvent] = {}
         self._git_timer: Optional[threading.Timer] = None
         self._git_last_path: str = ""
@@ -101,7 +108,9 @@ class DebouncedEventHandler(FileSystemEventHandler):
         if not isinstance(dest_path, str):
             dest_path = ""
 
-        key = src_path
+        # Repeat events for a path then share one key object (and its cached
+        # hash) across the timer/pending maps.
+        key = sys.intern(src_path)
         if _is_git_event(src_path) or _is_git_event(dest_path):
             if self.git_callback:
                 with self._lock:
@@ -124,24 +133,47 @@ class DebouncedEventHandler(FileSystemEventHandler):
 
             # Burst control: token bucket
             if not self._try_consume_token(fs_event.ts):
-                if key in self._timers:
-                    self._timers[key].cancel()
-                    del self._timers[key]
+                self._deadlines.pop(key, None)
                 self._pending_events[key] = fs_event
                 self._schedule_bucket_flush()
                 return
 
-            if key in self._timers:
-                self._timers[key].cancel()
             self._pending_events[key] = fs_event
-            t = threading.Timer(self.debounce_seconds, self._trigger, args=[key])
-            self._timers[key] = t
-            t.start()
+            # A burst on one path only pushes its deadline out; the scheduler
+            # re-queues the heap entry until the path has gone quiet.
+            if key not in self._deadlines:
+                heapq.heappush(self._due, (fs_event.ts + self.debounce_seconds, key))
+                self._wake.notify()
+            self._deadlines[key] = fs_event.ts + self.debounce_seconds
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(target=self._run_scheduler, name="sari-watcher-debounce", daemon=True)
+                self._scheduler.start()
+
+    def _run_scheduler(self) -> None:
+        while True:
+            with self._wake:
+                while True:
+                    if not self._due:
+                        self._wake.wait()
+                        continue
+                    due, key = self._due[0]
+                    remaining = due - time.time()
+                    if remaining > 0:
+                        self._wake.wait(remaining)
+                        continue
+                    heapq.heappop(self._due)
+                    deadline = self._deadlines.get(key)
+                    if deadline is None:
+                        continue  # dispatched or handed to the bucket meanwhile
+                    if deadline > due:
+                        heapq.heappush(self._due, (deadline, key))
+                        continue
+                    break
+            self._trigger(key)
 
     def _trigger(self, path: str):
         with self._lock:
-            if path in self._timers:
-                del self._timers[path]
+            self._deadlines.pop(path, None)
             fs_event = self._pending_events.pop(path, None)
         if not fs_event:
             return
@@ -234,6 +266,8 @@ class FileWatcher:
         self._running = False
         self._monitor_thread = None
         self._stop_event = threading.Event()
+        self._norm_roots_key: Optional[tuple] = None
+        self._norm_roots: List[str] = []
 
     def start(self):
         if not HAS_WATCHDOG:
@@ -382,9 +416,17 @@ class FileWatcher:
         if not event_path:
             return ""
         norm_event = WorkspaceManager.normalize_path(event_path)
-        roots = [WorkspaceManager.normalize_path(p) for p in self.paths if p]
-        roots.sort(key=len, reverse=True)
-        for root in roots:
+        for root in self._normalized_roots():
             if norm_event == root or norm_event.startswith(root + os.sep):
                 return root
         return ""
+
+    def _normalized_roots(self) -> List[str]:
+        # normalize_path resolves symlinks (a syscall per component), so the
+        # watched roots are normalized once rather than on every event.
+        key = tuple(self.paths)
+        if key != self._norm_roots_key:
+            roots = [WorkspaceManager.normalize_path(p) for p in key if p]
+            roots.sort(key=len, reverse=True)
+            self._norm_roots, self._norm_roots_key = roots, key
+        return self._norm_roots
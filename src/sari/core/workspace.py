@@ -4,16 +4,20 @@ import hashlib
 import json
 import shutil
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 from sari.core.settings import settings
 
 class WorkspaceManager:
     """Manages workspace detection, explicit boundaries (.sariroot), and global paths."""
     settings = settings
+    # Absolute workspace path -> root id. Hashing needs a resolve() + sha1, and tools ask per call.
+    _root_id_cache: Dict[str, str] = {}
+    _ROOT_ID_CACHE_MAX = 1024
 
     @staticmethod
     def set_settings(settings_obj):
         WorkspaceManager.settings = settings_obj
+        WorkspaceManager._root_id_cache.clear()
 
     @staticmethod
     def find_project_root(path: str) -> str:
@@ -59,9 +63,21 @@ class WorkspaceManager:
     @staticmethod
     def root_id_for_workspace(workspace_root: str) -> str:
         """Stable root id for an explicit workspace root."""
+        cache = WorkspaceManager._root_id_cache
+        # Relative paths depend on the cwd, so only absolute inputs are memoized.
+        cacheable = bool(workspace_root) and os.path.isabs(workspace_root)
+        if cacheable:
+            cached = cache.get(workspace_root)
+            if cached is not None:
+                return cached
         root = WorkspaceManager.normalize_path(workspace_root)
         digest = hashlib.sha1(root.encode("utf-8")).hexdigest()[:12]
-        return f"root-{digest}"
+        rid = f"root-{digest}"
+        if cacheable:
+            if len(cache) >= WorkspaceManager._ROOT_ID_CACHE_MAX:
+                cache.clear()
+            cache[workspace_root] = rid
+        return rid
 
     @staticmethod
     def _normalize_path(path: str, follow_symlinks: bool) -> str:
@@ -6,6 +6,13 @@ from pathlib import Path
 
 REQUIRED_LIBRARIES = ["peewee", "tenacity", "filelock", "psutil"]
 
+def _pip_install_cmd(*args: str) -> list:
+    """Prefer uv's resolver when available; it installs into this interpreter either way."""
+    uv = shutil.which("uv")
+    if uv:
+        return [uv, "pip", "install", "--python", sys.executable, *args]
+    return [sys.executable, "-m", "pip", "install", *args]
+
 def check_dependencies():
     print("Verifying infrastructure dependencies...")
     missing = []
@@ -18,7 +25,7 @@ def check_dependencies():
     if missing:
         print(f"Missing libraries: {', '.join(missing)}")
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+            subprocess.check_call(_pip_install_cmd("-r", "requirements.txt"))
             print("Dependencies installed successfully.")
         except Exception as e:
             print(f"Error installing dependencies: {e}")
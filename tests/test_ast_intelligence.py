@@ -57,4 +57,28 @@ def test_python_decorator_extraction():
     metadata = json.loads(idx_symbol[7])
     # Note: PythonHandler might store decorators differently, checking all annotations
     assert any("login_required" in a for f in metadata.get("annotations", []) for a in (f if isinstance(f, list) else [f]))
-    assert any("route" in a for f in metadata.get("annotations", []) for a in (f if isinstance(f, list) else [f]))
\ No newline at end of file
+    assert any("route" in a for f in metadata.get("annotations", []) for a in (f if isinstance(f, list) else [f]))
+def test_parse_tree_feeds_extract_symbols():
+    """
+    The indexer parses once via parse() and hands the tree to extract_symbols.
+    """
+    engine = ASTEngine()
+    if not engine.enabled:
+        pytest.skip("tree-sitter not installed")
+    code = "public class A {\n    public void run() {}\n}\n"
+    tree = engine.parse("java", code)
+    assert tree is not None
+    symbols, _ = engine.extract_symbols("A.java", "java", code, tree=tree)
+    assert {"A", "run"} <= {s[1] for s in symbols}
+    assert engine.parse("no-such-language", code) is None
+
+def test_deeply_nested_source_keeps_symbols():
+    """
+    Nesting deeper than the interpreter's recursion limit must not drop symbols.
+    """
+    engine = ASTEngine()
+    if not engine.enabled:
+        pytest.skip("tree-sitter not installed")
+    code = "x = " + "(" * 3000 + "1" + ")" * 3000 + "\ndef after():\n    pass\n"
+    symbols, _ = engine.extract_symbols("deep.py", "python", code)
+    assert "after" in {s[1] for s in symbols}
@@ -48,8 +48,17 @@ def test_embedded_engine_status():
             assert status.engine_mode == "embedded"
 
 
+@pytest.fixture
+def bare_tantivy_engine(tmp_path):
+    """A TantivyEngine built through __init__ with no binding loaded, ready for a fake index."""
+    engine_settings = MagicMock()
+    engine_settings.ENGINE_INDEX_MEM_MB = 64
+    with patch("sari.core.engine.tantivy_engine.tantivy", None):
+        return TantivyEngine(str(tmp_path / "idx"), settings_obj=engine_settings)
+
+
 @pytest.mark.gate
-def test_tantivy_upsert_accepts_id_key():
+def test_tantivy_upsert_accepts_id_key(bare_tantivy_engine):
     class FakeWriter:
         def __init__(self):
             self.deleted = []
@@ -68,13 +77,8 @@ def test_tantivy_upsert_accepts_id_key():
             return self._writer
 
     fake_writer = FakeWriter()
-    engine = TantivyEngine.__new__(TantivyEngine)
+    engine = bare_tantivy_engine
     engine._index = FakeIndex(fake_writer)
-    engine._writer = None
-    engine._writer_lock = __import__("threading").Lock()
-    engine.settings = MagicMock()
-    engine.settings.ENGINE_INDEX_MEM_MB = 64
-    engine.logger = None
 
     with patch("sari.core.engine.tantivy_engine.tantivy") as mock_tantivy:
         mock_tantivy.Document.side_effect = lambda **kwargs: kwargs
@@ -82,3 +86,91 @@ def test_tantivy_upsert_accepts_id_key():
 
     assert ("path", "root1/file.py") in fake_writer.deleted
     assert len(fake_writer.added) == 1
+
+
+def test_tantivy_writer_budget_has_per_thread_floor(bare_tantivy_engine):
+    engine = bare_tantivy_engine
+    engine.settings.ENGINE_THREADS = 8
+
+    heap, threads = engine._writer_limits()
+    assert threads == 8
+    assert heap == 160 * 1024 * 1024
+
+    engine.settings.ENGINE_INDEX_MEM_MB = 512
+    heap, _ = engine._writer_limits()
+    assert heap == 512 * 1024 * 1024
+
+
+def test_tantivy_reuses_writer_and_throttles_commits(bare_tantivy_engine):
+    writer = MagicMock(spec=["delete_documents", "add_document", "commit"])
+    index = MagicMock()
+    index.writer.return_value = writer
+    engine = bare_tantivy_engine
+    engine._index = index
+    engine.settings.ENGINE_INDEX_MEM_MB = 256
+    engine.settings.ENGINE_THREADS = 2
+
+    with patch("sari.core.engine.tantivy_engine.tantivy") as mock_tantivy:
+        mock_tantivy.Document.side_effect = lambda **kwargs: kwargs
+        engine.upsert_documents([{"id": "root1/a.py"}])
+        engine.upsert_documents([{"id": "root1/b.py"}])
+        engine.delete_documents(["root1/a.py"])
+        assert index.writer.call_count == 1
+        assert writer.commit.call_count == 1
+
+        engine.commit()
+        assert writer.commit.call_count == 2
+
+
+def test_tantivy_index_size_is_cached_until_commit(tmp_path, bare_tantivy_engine):
+    engine = bare_tantivy_engine
+    engine.index_path = tmp_path
+    (tmp_path / "seg1").write_bytes(b"x" * 10)
+
+    assert engine.index_size_bytes() == 10
+    (tmp_path / "seg2").write_bytes(b"x" * 5)
+    assert engine.index_size_bytes() == 10
+
+    engine._index_size_cache = (0, 0.0)
+    assert engine.index_size_bytes() == 15
+
+
+def test_tantivy_rebuild_swaps_in_fresh_index(tmp_path):
+    pytest.importorskip("tantivy")
+    engine = TantivyEngine(str(tmp_path / "idx"))
+    engine.upsert_documents([{"doc_id": "old/a.py", "root_id": "old", "body_text": "needle"}])
+    engine.commit()
+
+    docs = ({"doc_id": f"new/{i}.py", "root_id": "new", "body_text": "needle"} for i in range(5))
+    assert engine.rebuild(docs) == 5
+    engine._last_reload_ts = 0.0
+    paths = sorted(h["path"] for h in engine.search("needle", limit=10))
+    assert paths == [f"new/{i}.py" for i in range(5)]
+    assert not (tmp_path / "idx.rebuild").exists()
+
+
+def test_tantivy_rebuild_replays_writes_made_during_build(tmp_path):
+    pytest.importorskip("tantivy")
+    import threading
+    engine = TantivyEngine(str(tmp_path / "idx"))
+    started, release = threading.Event(), threading.Event()
+
+    def docs():
+        yield {"doc_id": "new/0.py", "root_id": "new", "body_text": "needle"}
+        started.set()
+        release.wait(5)
+        yield {"doc_id": "new/1.py", "root_id": "new", "body_text": "needle"}
+
+    rebuild = threading.Thread(target=engine.rebuild, args=(docs(),))
+    rebuild.start()
+    assert started.wait(5)
+    # The build doesn't hold the writer lock, so live writes go through meanwhile.
+    engine.upsert_documents([{"doc_id": "live/a.py", "root_id": "live", "body_text": "needle"}])
+    engine.delete_documents(["new/0.py"])
+    release.set()
+    rebuild.join(10)
+
+    engine._last_reload_ts = 0.0
+    paths = sorted(h["path"] for h in engine.search("needle", limit=10))
+    assert paths == ["live/a.py", "new/1.py"]
+    assert not (tmp_path / "idx.old").exists()
@@ -48,3 +48,30 @@ def test_indexer_lifecycle_cleanup(test_context):
     assert indexer._executor is not None
     indexer.stop()
     assert indexer._executor is None
+
+
+def test_worker_reuses_extraction_for_unchanged_content(tmp_path):
+    from unittest.mock import MagicMock
+    from sari.core.indexer.worker import IndexWorker
+
+    calls = []
+    def extractor(path, content):
+        calls.append(path)
+        return [(path, "add", "section", 1, 1, "", "", "{}", "", "add", "sid")], []
+
+    root = tmp_path / "ws"
+    root.mkdir()
+    f = root / "notes.txt"
+    f.write_text("add: returns a+b")
+    db = MagicMock()
+    db.get_file_meta.return_value = None
+    worker = IndexWorker(MagicMock(), db, None, extractor)
+
+    first = worker.process_file_task(root, f, f.stat(), 1, time.time(), False, root_id="r", force=True)
+    second = worker.process_file_task(root, f, f.stat(), 2, time.time(), False, root_id="r", force=True)
+    assert len(calls) == 1
+    assert second["symbols"] == first["symbols"]
+
+    f.write_text("sub: returns a-b")
+    worker.process_file_task(root, f, f.stat(), 3, time.time(), False, root_id="r", force=True)
+    assert len(calls) == 2
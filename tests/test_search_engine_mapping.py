@@ -1,5 +1,5 @@
 import pytest
-from sari.core.search_engine import SearchEngine
+from sari.core.search_engine import SearchEngine, _path_filter
 from sari.core.models import SearchOptions
 
 pytestmark = pytest.mark.gate
@@ -31,3 +31,40 @@ def test_process_sqlite_rows_handles_fts_shape():
     assert hits[0].repo == "repo1"
     assert hits[0].mtime == 100
     assert hits[0].size == 12
+
+
+def test_path_filter_applies_pattern_and_excludes():
+    keep = _path_filter(SearchOptions(query="x", path_pattern="src/*.py", exclude_patterns=["test_"]))
+    assert keep("root-1/src/a.py")
+    assert not keep("root-1/src/test_a.py")
+    assert not keep("root-1/lib/a.py")
+    assert _path_filter(SearchOptions(query="x")) is None
+
+
+def test_path_filter_canonicalizes_file_types():
+    keep = _path_filter(SearchOptions(query="x", file_types=[".PY", "md"]))
+    assert keep("root-1/src/a.py")
+    assert keep("root-1/README.MD")
+    assert not keep("root-1/src/a.js")
+
+
+def test_repo_candidates_uses_fts_when_enabled():
+    import sqlite3
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE files(path, rel_path, root_id, repo, fts_content, deleted_ts INTEGER DEFAULT 0)")
+    conn.execute(
+        "CREATE VIRTUAL TABLE files_fts USING fts5(root_id, rel_path, repo, fts_content, content='files', content_rowid='rowid')"
+    )
+    for path, repo in [("a/authentication.py", "A"), ("b/auth_util.py", "B"), ("b/AuthX.java", "B"), ("c/other.py", "C")]:
+        conn.execute("INSERT INTO files VALUES(?,?,?,?,?,0)", (f"root-1/{path}", path, "root-1", repo, ""))
+    conn.execute("INSERT INTO files_fts(files_fts) VALUES('rebuild')")
+
+    engine = _build_engine()
+    engine.db = type("DummyDB", (), {
+        "settings": type("S", (), {"ENABLE_FTS": True})(),
+        "_get_conn": lambda self: conn,
+    })()
+    cands = engine.repo_candidates("auth", limit=3)
+    assert [c["repo"] for c in cands] == ["B", "A"]
+    assert cands[0]["score"] == 2
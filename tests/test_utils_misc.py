@@ -42,3 +42,12 @@ def test_workspace_normalize_path_empty_falls_back_to_cwd():
     out = WorkspaceManager.normalize_path("")
     assert isinstance(out, str)
     assert out != ""
+
+
+def test_workspace_root_id_is_memoized_for_absolute_paths(tmp_path, monkeypatch):
+    ws = str(tmp_path)
+    first = WorkspaceManager.root_id_for_workspace(ws)
+    calls = []
+    monkeypatch.setattr(WorkspaceManager, "normalize_path", staticmethod(lambda p: calls.append(p) or p))
+    assert WorkspaceManager.root_id_for_workspace(ws) == first
+    assert calls == []